@@ -4,6 +4,7 @@ from .security import (
     create_refresh_token,
     decode_token,
     hash_password,
+    hash_password_async,
     oauth2_scheme,
     verify_password,
 )
@@ -12,6 +13,7 @@ __all__ = [
     "settings",
     "oauth2_scheme",
     "hash_password",
+    "hash_password_async",
     "verify_password",
     "create_access_token",
     "create_refresh_token",
@@ -0,0 +1,86 @@
+import functools
+from collections.abc import Callable
+from typing import Any
+
+from fastapi import Response
+from pydantic import TypeAdapter
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+
+redis_client: Redis | None = (
+    Redis.from_url(
+        settings.redis_url,
+        socket_timeout=settings.redis_timeout_seconds,
+        socket_connect_timeout=settings.redis_timeout_seconds,
+    )
+    if settings.redis_url
+    else None
+)
+
+
+def cached(namespace: str, response_model: Any, key: Callable[..., str], ttl: int | None = None) -> Callable:
+    """
+    Cache JSON response endpoint di Redis.
+
+    Hasil endpoint di-serialize sekali via TypeAdapter(response_model) lalu bytes-nya
+    disimpan di Redis; cache hit langsung dikembalikan sebagai Response tanpa query DB
+    dan tanpa validasi pydantic. Jika REDIS_URL kosong atau Redis error, endpoint
+    tetap jalan normal (cache bersifat best-effort).
+
+    Usage:
+        @router.get("/roles/", response_model=list[RoleSchema])
+        @cached("roles", list[RoleSchema], key=lambda skip, limit, **_: f"{skip}:{limit}")
+        async def get_roles(...): ...
+    """
+    adapter = TypeAdapter(response_model)
+    expire = ttl or settings.cache_ttl_seconds
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(**kwargs: Any) -> Response:
+            cache_key = f"cache:{namespace}:{key(**kwargs)}"
+
+            if redis_client is not None:
+                try:
+                    hit = await redis_client.get(cache_key)
+                except RedisError:
+                    hit = None
+                if hit is not None:
+                    return Response(content=hit, media_type="application/json")
+
+            result = await func(**kwargs)
+            content = adapter.dump_json(adapter.validate_python(result, from_attributes=True))
+
+            if redis_client is not None:
+                try:
+                    await redis_client.set(cache_key, content, ex=expire)
+                except RedisError:
+                    pass
+
+            return Response(content=content, media_type="application/json")
+
+        return wrapper
+
+    return decorator
+
+
+async def invalidate(*namespaces: str) -> None:
+    """Hapus semua cache entry untuk namespace yang diberikan (dipanggil setelah create/update)."""
+    if redis_client is None:
+        return
+
+    try:
+        for namespace in namespaces:
+            keys = [cache_key async for cache_key in redis_client.scan_iter(match=f"cache:{namespace}:*")]
+            if keys:
+                await redis_client.delete(*keys)
+    except RedisError:
+        pass
+
+
+async def close_cache() -> None:
+    """Tutup koneksi Redis milik `redis_client`; dipanggil saat aplikasi shutdown."""
+    if redis_client is not None:
+        await redis_client.aclose()
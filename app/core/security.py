@@ -1,3 +1,7 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -10,6 +14,18 @@ from app.core.config import settings
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
+# bcrypt CPU-bound (puluhan-ratusan ms); jalankan di process pool agar tidak memblokir event loop.
+# Pool dibuat lazy (dan dibuat ulang setelah shutdown_hash_pool), worker via spawn (bukan fork)
+# agar tidak mewarisi event loop, koneksi DB/Redis, dan thread dari proses aplikasi.
+_hash_pool: ProcessPoolExecutor | None = None
+
+
+def _get_hash_pool() -> ProcessPoolExecutor:
+    global _hash_pool
+    if _hash_pool is None:
+        _hash_pool = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn"))
+    return _hash_pool
+
 
 class TokenError(Exception):
     pass
@@ -19,6 +35,19 @@ def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def hash_password_async(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_hash_pool(), hash_password, password)
+
+
+async def shutdown_hash_pool() -> None:
+    """Hentikan worker process hashing (di thread, tanpa memblokir event loop); dipanggil saat aplikasi shutdown."""
+    global _hash_pool
+    pool, _hash_pool = _hash_pool, None
+    if pool is not None:
+        await asyncio.to_thread(pool.shutdown, cancel_futures=True)
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
@@ -6,10 +6,23 @@ from app.core.config import settings
 from app.models import Base
 
 # Create async engine
+# pool_pre_ping dimatikan secara default: setiap checkout jadi tidak perlu RTT
+# tambahan untuk SELECT 1. Koneksi basi ditangani lewat pool_recycle dan
+# invalidasi otomatis SQLAlchemy saat asyncpg melempar error koneksi.
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
-    pool_pre_ping=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=settings.db_pool_pre_ping,
+    # Jumlah row per multi-VALUES INSERT saat bulk insert (executemany) dipecah per halaman
+    insertmanyvalues_page_size=settings.db_insertmanyvalues_page_size,
+    connect_args={
+        "statement_cache_size": settings.db_statement_cache_size,
+        "prepared_statement_cache_size": settings.db_statement_cache_size // 2,
+        "server_settings": {"jit": "off"},
+    },
 )
 
 # Session factory
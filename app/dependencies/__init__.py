@@ -1,3 +1,4 @@
 from .auth import get_current_user, require_permissions
+from .body import json_body, json_body_openapi
 
-__all__ = ["get_current_user", "require_permissions"]
+__all__ = ["get_current_user", "json_body", "json_body_openapi", "require_permissions"]
@@ -1,7 +1,7 @@
 import uuid
 from collections.abc import Callable
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -12,6 +12,7 @@ from app.models import Role, User
 
 
 async def get_current_user(
+    request: Request,
     token: str = Depends(oauth2_scheme),
     db: AsyncSession = Depends(get_db),
 ) -> User:
@@ -33,14 +34,22 @@ async def get_current_user(
     if not user or not user.is_active or user.deleted_at is not None:
         raise credentials_exception
 
+    # Memoize permission codes per request; semua permission_guard di request yang sama
+    # (FastAPI men-cache get_current_user per request) cukup membaca set ini.
+    request.state.permissions = frozenset(permission.code for role in user.roles for permission in role.permissions)
+
     return user
 
 
 def require_permissions(*required_permissions: str) -> Callable:
-    async def permission_guard(current_user: User = Depends(get_current_user)) -> User:
-        user_permissions = {permission.code for role in current_user.roles for permission in role.permissions}
+    required = frozenset(required_permissions)
+
+    async def permission_guard(request: Request, current_user: User = Depends(get_current_user)) -> User:
+        user_permissions = getattr(request.state, "permissions", None)
+        if user_permissions is None:
+            user_permissions = frozenset(permission.code for role in current_user.roles for permission in role.permissions)
 
-        if not set(required_permissions).issubset(user_permissions):
+        if not required <= user_permissions:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Insufficient permissions",
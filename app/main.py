@@ -1,9 +1,23 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.core.cache import close_cache
 from app.core.config import settings
+from app.core.security import shutdown_hash_pool
 from app.routers import auth, inventory, production, products, purchasing, sales, users, warehouse
 
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """Startup/shutdown aplikasi: bereskan resource level proses saat shutdown."""
+    yield
+    await shutdown_hash_pool()
+    await close_cache()
+
+
 # Create FastAPI application
 app = FastAPI(
     title=settings.app_name,
@@ -11,6 +25,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs" if settings.is_development else None,
     redoc_url="/redoc" if settings.is_development else None,
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, ForeignKey, Index, Integer, String, func
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, String, func, text
 from sqlalchemy.dialects.postgresql import JSONB, NUMERIC as Numeric, TIMESTAMP, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.schema import FetchedValue
@@ -25,7 +25,7 @@ if TYPE_CHECKING:
 class Location(Base):
     __tablename__ = "locations"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, server_default=text("gen_random_uuid()"))
     code: Mapped[str] = mapped_column(String(50), unique=True, nullable=False, index=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     type: Mapped[str] = mapped_column(String(50), nullable=False)
@@ -46,7 +46,7 @@ class Location(Base):
 class Product(Base, TimestampMixin):
     __tablename__ = "products"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, server_default=text("gen_random_uuid()"))
     sku: Mapped[str] = mapped_column(String(50), unique=True, nullable=False, index=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     category: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
@@ -76,10 +76,10 @@ class Product(Base, TimestampMixin):
 
 class StockLedger(Base):
     __tablename__ = "stock_ledgers"
-    # Untuk volume besar, pertimbangkan table partitioning di PostgreSQL
-    # berdasarkan created_at (monthly). Implementasikan via Alembic migration.
+    # Di PostgreSQL tabel ini di-partisi per bulan berdasarkan created_at (migration
+    # c4e8a2f61b37, primary key DB = (id, created_at)); create_all membuat tabel biasa.
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, server_default=text("gen_random_uuid()"))
     product_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("products.id", ondelete="RESTRICT"), nullable=False, index=True)
     location_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("locations.id", ondelete="RESTRICT"), nullable=False, index=True)
     # Positif = stok masuk, negatif = stok keluar
@@ -14,6 +14,7 @@ from sqlalchemy import (
     Numeric,
     String,
     Text,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -32,7 +33,7 @@ if TYPE_CHECKING:
 class SalesOrder(Base, TimestampMixin):
     __tablename__ = "sales_orders"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, server_default=text("gen_random_uuid()"))
     so_number: Mapped[str] = mapped_column(String(50), unique=True, nullable=False, index=True)
     customer_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("customers.id", ondelete="RESTRICT"), nullable=False, index=True)
     status: Mapped[str] = mapped_column(String(50), nullable=False, default="draft", index=True)
@@ -48,11 +49,16 @@ class SalesOrder(Base, TimestampMixin):
 
     __table_args__ = (Index("idx_so_customer_status", "customer_id", "status"),)
 
+    @property
+    def total_amount_cents(self) -> int:
+        """Numeric(15, 2) sebagai integer sen, dibaca oleh SalesOrderRead."""
+        return int(self.total_amount * 100)
+
 
 class SalesOrderItem(Base):
     __tablename__ = "sales_order_items"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, server_default=text("gen_random_uuid()"))
     so_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("sales_orders.id", ondelete="CASCADE"), nullable=False, index=True)
     product_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("products.id", ondelete="RESTRICT"), nullable=False, index=True)
     qty_ordered: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -70,6 +76,11 @@ class SalesOrderItem(Base):
         CheckConstraint("unit_price >= 0", name="ck_so_item_unit_price_non_negative"),
     )
 
+    @property
+    def unit_price_cents(self) -> int:
+        """Numeric(15, 2) sebagai integer sen, dibaca oleh SalesOrderItemRead."""
+        return int(self.unit_price * 100)
+
 
 # ---------------------------------------------------------------------------
 # Production: Production Order
@@ -1,6 +1,6 @@
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -18,6 +18,7 @@ from app.database import get_db
 from app.dependencies import get_current_user
 from app.models import Role, User
 from app.schemas.auth import (
+    USER_READ_ADAPTER,
     BootstrapAdminRequest,
     BootstrapAdminResponse,
     RBACSeedSummary,
@@ -84,7 +85,7 @@ async def bootstrap_admin(
         ) from exc
 
     return BootstrapAdminResponse(
-        user=UserRead.model_validate(user),
+        user=USER_READ_ADAPTER.validate_python(user, from_attributes=True),
         rbac_seed=RBACSeedSummary(**seed_summary_dict),
     )
 
@@ -164,5 +165,6 @@ async def refresh_tokens(
 
 
 @router.get("/me", response_model=UserRead)
-async def read_current_user(current_user: User = Depends(get_current_user)) -> User:
-    return current_user
+async def read_current_user(current_user: User = Depends(get_current_user)) -> Response:
+    user_read = USER_READ_ADAPTER.validate_python(current_user, from_attributes=True)
+    return Response(content=USER_READ_ADAPTER.dump_json(user_read), media_type="application/json")
@@ -2,17 +2,22 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import Float, cast, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
-from app.dependencies import require_permissions
+from app.dependencies import json_body, json_body_openapi, require_permissions
 from app.models import User
 from app.models.inventory import Location, Product, StockBalance, StockLedger
 from app.schemas.inventory import (
+    INVENTORY_JSON_ENCODER,
+    STOCK_MOVE_ADAPTER,
     InventoryReport,
+    InventoryReportDTO,
     InventorySummary,
+    InventorySummaryDTO,
+    StockMovementResponseDTO,
     StockBalance as StockBalanceSchema,
     StockLedger as StockLedgerSchema,
     StockLedgerCreate,
@@ -43,7 +48,7 @@ async def get_stock_balances(
     query = query.offset(skip).limit(limit)
     result = await db.execute(query)
     balances = result.scalars().all()
-    return [StockBalanceSchema.model_validate(balance) for balance in balances]
+    return [StockBalanceSchema.from_orm_trusted(balance) for balance in balances]
 
 
 @router.get("/stock-ledgers/", response_model=list[StockLedgerSchema])
@@ -68,7 +73,7 @@ async def get_stock_ledgers(
 
     query = query.order_by(StockLedger.created_at.desc()).offset(skip).limit(limit)
     result = await db.execute(query)
-    return result.scalars().all()
+    return [StockLedgerSchema.from_orm_trusted(ledger) for ledger in result.scalars().all()]
 
 
 @router.post("/stock-ledgers/", response_model=StockLedgerSchema)
@@ -87,9 +92,13 @@ async def create_stock_ledger(
     return db_ledger
 
 
-@router.post("/stock-movements/", response_model=StockMovementResponse)
+@router.post(
+    "/stock-movements/",
+    response_model=StockMovementResponse,
+    openapi_extra=json_body_openapi(STOCK_MOVE_ADAPTER),
+)
 async def create_stock_movement(
-    movement: StockMovementRequest,
+    movement: StockMovementRequest = Depends(json_body(STOCK_MOVE_ADAPTER)),
     db: AsyncSession = Depends(get_db),
     _: User = Depends(require_permissions("inventory:create")),
 ):
@@ -104,7 +113,6 @@ async def create_stock_movement(
         if movement.from_location_id:
             # Create OUT entry
             out_ledger = StockLedger(
-                id=uuid.uuid4(),
                 product_id=movement.product_id,
                 location_id=movement.from_location_id,
                 transaction_type="OUT",
@@ -117,7 +125,6 @@ async def create_stock_movement(
 
         # Create IN entry
         in_ledger = StockLedger(
-            id=uuid.uuid4(),
             product_id=movement.product_id,
             location_id=movement.to_location_id,
             transaction_type="IN",
@@ -134,17 +141,32 @@ async def create_stock_movement(
 
         await db.commit()
 
-        return {
-            "success": True,
-            "message": f"Stock movement completed: {movement.quantity} units",
-            "movement_id": str(uuid.uuid4()),
-        }
+        response = StockMovementResponseDTO(success=True, message=f"Stock movement completed: {movement.quantity} units")
+        return Response(content=INVENTORY_JSON_ENCODER.encode(response), media_type="application/json")
 
     except Exception as e:
         await db.rollback()
         raise HTTPException(status_code=400, detail=f"Stock movement failed: {str(e)}")
 
 
+def _inventory_report_query():
+    """Select inventory rows already shaped (labelled, in field order) like InventoryReportDTO."""
+    return (
+        select(
+            StockBalance.product_id,
+            Product.sku.label("product_sku"),
+            Product.name.label("product_name"),
+            StockBalance.location_id,
+            Location.name.label("location_name"),
+            StockBalance.current_qty,
+            StockBalance.last_updated,
+            cast(StockBalance.current_qty * 100.0, Float).label("total_value"),  # Assuming unit price of 100
+        )
+        .join(Product, StockBalance.product_id == Product.id)
+        .join(Location, StockBalance.location_id == Location.id)
+    )
+
+
 @router.get("/reports/inventory/", response_model=InventorySummary)
 async def get_inventory_report(
     db: AsyncSession = Depends(get_db),
@@ -153,43 +175,20 @@ async def get_inventory_report(
     """Get comprehensive inventory report"""
 
     # Get inventory data with product and location info
-    query = (
-        select(
-            StockBalance,
-            Product.sku,
-            Product.name,
-            Location.name,
-        )
-        .join(Product, StockBalance.product_id == Product.id)
-        .join(Location, StockBalance.location_id == Location.id)
-    )
-
-    result = await db.execute(query)
+    result = await db.execute(_inventory_report_query())
     inventory_data = result.all()
 
     # Calculate summary
-    total_products = len(set(item[0].product_id for item in inventory_data))
-    total_locations = len(set(item[0].location_id for item in inventory_data))
-    total_value = sum(item[0].current_qty for item in inventory_data)
-
-    low_stock_items = [item for item in inventory_data if item[0].current_qty < 10]
-    out_of_stock_items = [item for item in inventory_data if item[0].current_qty == 0]
-
-    report_data = [
-        InventoryReport(
-            product_id=item[0].product_id,
-            product_sku=item[1],
-            product_name=item[2],
-            location_id=item[0].location_id,
-            location_name=item[3],
-            current_qty=item[0].current_qty,
-            last_updated=item[0].last_updated,
-            total_value=item[0].current_qty * 100.0,  # Assuming unit price of 100
-        )
-        for item in inventory_data
-    ]
+    total_products = len(set(item.product_id for item in inventory_data))
+    total_locations = len(set(item.location_id for item in inventory_data))
+    total_value = sum(item.current_qty for item in inventory_data)
 
-    return InventorySummary(
+    low_stock_items = [item for item in inventory_data if item.current_qty < 10]
+    out_of_stock_items = [item for item in inventory_data if item.current_qty == 0]
+
+    report_data = [InventoryReportDTO(*row) for row in inventory_data]
+
+    summary = InventorySummaryDTO(
         total_products=total_products,
         total_locations=total_locations,
         total_stock_value=total_value,
@@ -197,6 +196,7 @@ async def get_inventory_report(
         out_of_stock_items=len(out_of_stock_items),
         report_data=report_data,
     )
+    return Response(content=INVENTORY_JSON_ENCODER.encode(summary), media_type="application/json")
 
 
 @router.get("/reports/low-stock/", response_model=list[InventoryReport])
@@ -206,32 +206,9 @@ async def get_low_stock_report(
     _: User = Depends(require_permissions("inventory:read")),
 ):
     """Get low stock items report"""
-    query = (
-        select(
-            StockBalance,
-            Product.sku,
-            Product.name,
-            Location.name,
-        )
-        .join(Product, StockBalance.product_id == Product.id)
-        .join(Location, StockBalance.location_id == Location.id)
-        .where(StockBalance.current_qty <= threshold)
-        .order_by(StockBalance.current_qty.asc())
-    )
+    query = _inventory_report_query().where(StockBalance.current_qty <= threshold).order_by(StockBalance.current_qty.asc())
 
     result = await db.execute(query)
-    low_stock_items = result.all()
-
-    return [
-        InventoryReport(
-            product_id=item[0].product_id,
-            product_sku=item[1],
-            product_name=item[2],
-            location_id=item[0].location_id,
-            location_name=item[3],
-            current_qty=item[0].current_qty,
-            last_updated=item[0].last_updated,
-            total_value=item[0].current_qty * 100.0,  # Assuming unit price of 100
-        )
-        for item in low_stock_items
-    ]
+    low_stock_items = [InventoryReportDTO(*row) for row in result]
+
+    return Response(content=INVENTORY_JSON_ENCODER.encode(low_stock_items), media_type="application/json")
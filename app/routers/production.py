@@ -7,10 +7,11 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
-from app.dependencies import require_permissions
+from app.dependencies import json_body, json_body_openapi, require_permissions
 from app.models import User
 from app.models.production import BOM, ProductionOrder, WorkCenter
 from app.schemas.production import (
+    BOM_CREATE_ADAPTER,
     BOM as BOMSchema,
     BOMCreate,
     ProductionOrder as ProductionOrderSchema,
@@ -67,10 +68,7 @@ async def create_work_center(
     _: User = Depends(require_permissions("production:create")),
 ):
     """Create a new work center"""
-    import uuid
-
     db_work_center = WorkCenter(
-        id=uuid.uuid4(),
         code=work_center.code,
         name=work_center.name,
         type=work_center.type,
@@ -107,17 +105,18 @@ async def get_boms(
     return result.scalars().all()
 
 
-@router.post("/boms/", response_model=BOMSchema)
+@router.post(
+    "/boms/",
+    response_model=BOMSchema,
+    openapi_extra=json_body_openapi(BOM_CREATE_ADAPTER),
+)
 async def create_bom(
-    bom: BOMCreate,
+    bom: BOMCreate = Depends(json_body(BOM_CREATE_ADAPTER)),
     db: AsyncSession = Depends(get_db),
     _: User = Depends(require_permissions("production:create")),
 ):
     """Create a new BOM"""
-    import uuid
-
     db_bom = BOM(
-        id=uuid.uuid4(),
         product_id=bom.product_id,
         bom_name=bom.bom_name,
         version=bom.version,
@@ -150,7 +149,7 @@ async def get_production_orders(
 
     query = query.offset(skip).limit(limit)
     result = await db.execute(query)
-    return result.scalars().all()
+    return [ProductionOrderSchema.from_orm_trusted(order) for order in result.scalars().all()]
 
 
 @router.post("/production-orders/", response_model=ProductionOrderSchema)
@@ -160,10 +159,7 @@ async def create_production_order(
     _: User = Depends(require_permissions("production:create")),
 ):
     """Create a new production order"""
-    import uuid
-
     db_production_order = ProductionOrder(
-        id=uuid.uuid4(),
         order_number=production_order.order_number,
         bom_id=production_order.bom_id,
         work_center_id=production_order.work_center_id,
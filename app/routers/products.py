@@ -1,9 +1,10 @@
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import invalidate
 from app.database import get_db
 from app.dependencies import require_permissions
 from app.models import Product, ProductCategory, User
@@ -48,6 +49,7 @@ async def create_product(
     db.add(db_product)
     await db.commit()
     await db.refresh(db_product)
+    await invalidate("sales:products")
 
     return db_product
 
@@ -59,7 +61,7 @@ async def list_products(
     category: ProductCategory | None = None,
     db: AsyncSession = Depends(get_db),
     _: User = Depends(require_permissions("products:read")),
-) -> list[Product]:
+) -> list[ProductResponse]:
     """
     List semua products dengan pagination dan filter.
 
@@ -74,7 +76,7 @@ async def list_products(
 
     stmt = stmt.offset(skip).limit(min(limit, 100))
     products = (await db.scalars(stmt)).all()
-    return list(products)
+    return [ProductResponse.from_orm_trusted(product) for product in products]
 
 
 @router.get("/{product_id}", response_model=ProductResponse)
@@ -82,7 +84,7 @@ async def get_product(
     product_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
     _: User = Depends(require_permissions("products:read")),
-) -> Product:
+) -> ProductResponse:
     """
     Get detail product by ID.
     """
@@ -94,7 +96,7 @@ async def get_product(
             detail=f"Product with ID '{product_id}' not found",
         )
 
-    return product
+    return ProductResponse.from_orm_trusted(product)
 
 
 @router.put("/{product_id}", response_model=ProductResponse)
@@ -107,7 +109,13 @@ async def update_product(
     """
     Update product.
     """
-    product = await db.scalar(select(Product).where(Product.id == product_id))
+    # Update fields yang diberikan dalam satu UPDATE ... RETURNING (tanpa SELECT terpisah)
+    update_data = product_update.model_dump(exclude_unset=True)
+    if update_data:
+        stmt = update(Product).where(Product.id == product_id).values(**update_data).returning(Product).execution_options(synchronize_session=False)
+        product = (await db.execute(stmt)).scalar_one_or_none()
+    else:
+        product = await db.scalar(select(Product).where(Product.id == product_id))
 
     if not product:
         raise HTTPException(
@@ -115,13 +123,8 @@ async def update_product(
             detail=f"Product with ID '{product_id}' not found",
         )
 
-    # Update fields yang diberikan
-    update_data = product_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(product, field, value)
-
     await db.commit()
-    await db.refresh(product)
+    await invalidate("sales:products")
 
     return product
 
@@ -149,6 +152,7 @@ async def delete_product(
     try:
         await db.delete(product)
         await db.commit()
+        await invalidate("sales:products")
     except Exception as e:
         await db.rollback()
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"Cannot delete product: {str(e)}")
@@ -3,15 +3,16 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
-from app.dependencies import require_permissions
+from app.dependencies import json_body, json_body_openapi, require_permissions
 from app.models import User
 from app.models.master_data import Supplier
 from app.models.purchasing import PurchaseOrder
 from app.schemas.purchasing import (
+    PURCHASE_ORDER_CREATE_ADAPTER,
     PurchaseOrder as PurchaseOrderSchema,
     PurchaseOrderCreate,
     Supplier as SupplierSchema,
@@ -65,10 +66,7 @@ async def create_supplier(
     _: User = Depends(require_permissions("purchasing:create")),
 ):
     """Create a new supplier"""
-    import uuid
-
     db_supplier = Supplier(
-        id=uuid.uuid4(),
         code=supplier.code,
         name=supplier.name,
         contact_person=supplier.contact_person,
@@ -92,18 +90,18 @@ async def update_supplier(
     _: User = Depends(require_permissions("purchasing:update")),
 ):
     """Update supplier"""
-    result = await db.execute(select(Supplier).where(Supplier.id == supplier_id))
-    supplier = result.scalar_one_or_none()
+    # Hanya kolom tabel: contact_person/email/phone/address bukan kolom Supplier, jadi diabaikan (seperti setattr sebelumnya)
+    update_data = {key: value for key, value in supplier_update.model_dump(exclude_unset=True).items() if key in Supplier.__table__.columns}
+    if update_data:
+        stmt = update(Supplier).where(Supplier.id == supplier_id).values(**update_data).returning(Supplier).execution_options(synchronize_session=False)
+    else:
+        stmt = select(Supplier).where(Supplier.id == supplier_id)
+    supplier = (await db.execute(stmt)).scalar_one_or_none()
 
     if not supplier:
         raise HTTPException(status_code=404, detail="Supplier not found")
 
-    update_data = supplier_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(supplier, field, value)
-
     await db.commit()
-    await db.refresh(supplier)
 
     return supplier
 
@@ -147,7 +145,7 @@ async def get_purchase_orders(
 
     query = query.offset(skip).limit(limit)
     result = await db.execute(query)
-    return result.scalars().all()
+    return [PurchaseOrderSchema.from_orm_trusted(po) for po in result.scalars().all()]
 
 
 @router.get("/purchase-orders/{po_id}", response_model=PurchaseOrderSchema)
@@ -163,20 +161,21 @@ async def get_purchase_order(
     if not po:
         raise HTTPException(status_code=404, detail="Purchase order not found")
 
-    return po
+    return PurchaseOrderSchema.from_orm_trusted(po)
 
 
-@router.post("/purchase-orders/", response_model=PurchaseOrderSchema)
+@router.post(
+    "/purchase-orders/",
+    response_model=PurchaseOrderSchema,
+    openapi_extra=json_body_openapi(PURCHASE_ORDER_CREATE_ADAPTER),
+)
 async def create_purchase_order(
-    po: PurchaseOrderCreate,
+    po: PurchaseOrderCreate = Depends(json_body(PURCHASE_ORDER_CREATE_ADAPTER)),
     db: AsyncSession = Depends(get_db),
     _: User = Depends(require_permissions("purchasing:create")),
 ):
     """Create a new purchase order"""
-    import uuid
-
     db_po = PurchaseOrder(
-        id=uuid.uuid4(),
         po_number=po.po_number,
         supplier_id=po.supplier_id,
         status=po.status,
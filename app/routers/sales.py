@@ -8,10 +8,13 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.cache import cached
 from app.database import get_db
-from app.dependencies import require_permissions
+from app.dependencies import json_body, json_body_openapi, require_permissions
 from app.models import Customer, Product, SalesOrder, SalesOrderItem, User
 from app.schemas.sales import (
+    SALES_ORDER_CREATE_ADAPTER,
+    SALES_ORDER_READ_LIST_ADAPTER,
     SalesOrderCreate,
     SalesOrderList,
     SalesOrderRead,
@@ -52,7 +55,7 @@ async def get_sales_orders(
     orders = (await db.scalars(query)).all()
 
     return SalesOrderList(
-        sales_orders=[SalesOrderRead.model_validate(order) for order in orders],
+        sales_orders=SALES_ORDER_READ_LIST_ADAPTER.validate_python(orders, from_attributes=True),
         total=total or 0,
         page=page,
         size=size,
@@ -64,7 +67,7 @@ async def get_sales_order(
     order_id: UUID,
     db: AsyncSession = Depends(get_db),
     _: User = Depends(require_permissions("sales:read")),
-) -> SalesOrder:
+) -> SalesOrderRead:
     """Get a specific sales order by ID"""
     stmt = (
         select(SalesOrder)
@@ -79,18 +82,21 @@ async def get_sales_order(
     if not order:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Sales order not found")
 
-    return order
+    return SalesOrderRead.from_orm_trusted(order)
 
 
-@router.post("/orders", response_model=SalesOrderRead, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/orders",
+    response_model=SalesOrderRead,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=json_body_openapi(SALES_ORDER_CREATE_ADAPTER),
+)
 async def create_sales_order(
-    order_data: SalesOrderCreate,
+    order_data: SalesOrderCreate = Depends(json_body(SALES_ORDER_CREATE_ADAPTER)),
     db: AsyncSession = Depends(get_db),
     _: User = Depends(require_permissions("sales:create")),
 ) -> SalesOrder:
     """Create a new sales order"""
-    import uuid
-
     # Verify customer exists
     customer = await db.get(Customer, order_data.customer_id)
     if not customer:
@@ -121,7 +127,6 @@ async def create_sales_order(
 
     # Create sales order
     db_order = SalesOrder(
-        id=uuid.uuid4(),
         so_number=new_so_number,
         customer_id=order_data.customer_id,
         status=order_data.status or "draft",
@@ -131,23 +136,21 @@ async def create_sales_order(
     )
 
     # Add items
-    total_amount = Decimal("0")
+    # Total diakumulasi sebagai integer sen (Numeric(15, 2)), dikonversi ke Decimal sekali di akhir
+    total_cents = 0
     for item_data in order_data.items:
         products[item_data.product_id]
-        item_total = item_data.quantity * item_data.unit_price
-        total_amount += item_total
+        total_cents += item_data.quantity * item_data.unit_price_cents
 
         db_item = SalesOrderItem(
-            id=uuid.uuid4(),
-            so_id=db_order.id,
             product_id=item_data.product_id,
             qty_ordered=item_data.quantity,
-            unit_price=item_data.unit_price,
+            unit_price=Decimal(item_data.unit_price_cents).scaleb(-2),
             notes=item_data.notes,
         )
         db_order.items.append(db_item)
 
-    db_order.total_amount = total_amount
+    db_order.total_amount = Decimal(total_cents).scaleb(-2)
     db.add(db_order)
     await db.commit()
     await db.refresh(db_order)
@@ -156,36 +159,37 @@ async def create_sales_order(
 
 
 @router.get("/customers", response_model=list[dict])
+@cached("sales:customers", list[dict], key=lambda **_: "active")
 async def get_customers(
     db: AsyncSession = Depends(get_db),
     _: User = Depends(require_permissions("sales:read")),
 ) -> list[dict]:
     """Get list of all customers for dropdown"""
-    from app.models.master_data import Customer
-
-    customers = await db.execute(select(Customer).where(Customer.is_active).order_by(Customer.name))
-    return [{"id": str(c.id), "code": c.code, "name": c.name} for c in customers.scalars().all()]
+    stmt = select(Customer.id, Customer.code, Customer.name).where(Customer.is_active).order_by(Customer.name)
+    rows = (await db.execute(stmt)).all()
+    return [{"id": str(row.id), "code": row.code, "name": row.name} for row in rows]
 
 
 @router.get("/products", response_model=list[dict])
+@cached("sales:products", list[dict], key=lambda category, **_: category or "all")
 async def get_products(
     category: str | None = Query(None),
     db: AsyncSession = Depends(get_db),
     _: User = Depends(require_permissions("sales:read")),
 ) -> list[dict]:
     """Get list of all products for dropdown"""
-    query = select(Product).where(Product.is_active)
+    query = select(Product.id, Product.sku, Product.name, Product.category, Product.unit_price).where(Product.is_active)
     if category:
         query = query.where(Product.category == category)
 
-    products = await db.execute(query.order_by(Product.name))
+    rows = (await db.execute(query.order_by(Product.name))).all()
     return [
         {
-            "id": str(p.id),
-            "sku": p.sku,
-            "name": p.name,
-            "category": p.category,
-            "unit_price": float(p.unit_price),
+            "id": str(row.id),
+            "sku": row.sku,
+            "name": row.name,
+            "category": row.category,
+            "unit_price": float(row.unit_price),
         }
-        for p in products.scalars().all()
+        for row in rows
     ]
@@ -3,11 +3,12 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func, select
+from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.core.security import hash_password
+from app.core.cache import cached, invalidate
+from app.core.security import hash_password_async
 from app.database import get_db
 from app.dependencies import require_permissions
 from app.models.auth import Permission, Role, User
@@ -26,6 +27,7 @@ router = APIRouter()
 
 # Permission endpoints
 @router.get("/permissions/", response_model=list[PermissionSchema])
+@cached("permissions", list[PermissionSchema], key=lambda skip, limit, **_: f"{skip}:{limit}")
 async def get_permissions(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
@@ -56,6 +58,7 @@ async def get_permission(
 
 # Role endpoints
 @router.get("/roles/", response_model=list[RoleSchema])
+@cached("roles", list[RoleSchema], key=lambda skip, limit, **_: f"{skip}:{limit}")
 async def get_roles(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
@@ -91,15 +94,13 @@ async def create_role(
     _: User = Depends(require_permissions("users:create")),
 ):
     """Create a new role with permissions"""
-    import uuid
-
     # Check if role name already exists
     existing = await db.execute(select(Role).where(Role.name == role.name))
     if existing.scalar_one_or_none():
         raise HTTPException(status_code=400, detail="Role name already exists")
 
     # Create role
-    db_role = Role(id=uuid.uuid4(), name=role.name, description=role.description, is_active=role.is_active)
+    db_role = Role(name=role.name, description=role.description, is_active=role.is_active)
     db.add(db_role)
 
     # Add permissions to role
@@ -112,6 +113,7 @@ async def create_role(
 
     await db.commit()
     await db.refresh(db_role)
+    await invalidate("roles")
 
     return db_role
 
@@ -136,7 +138,7 @@ async def get_users(
 
     query = query.offset(skip).limit(limit)
     result = await db.execute(query)
-    return result.scalars().all()
+    return [UserSchema.from_orm_trusted(user) for user in result.scalars().all()]
 
 
 @router.get("/users/{user_id}", response_model=UserProfile)
@@ -162,25 +164,19 @@ async def create_user(
     _: User = Depends(require_permissions("users:create")),
 ):
     """Create a new user"""
-    import uuid
-
-    # Check if username already exists
-    existing = await db.execute(select(User).where(User.username == user.username))
-    if existing.scalar_one_or_none():
+    # Check if username or email already exists (single round-trip)
+    conflicts = (await db.execute(select(User.username, User.email).where(or_(User.username == user.username, User.email == user.email)))).all()
+    if any(conflict.username == user.username for conflict in conflicts):
         raise HTTPException(status_code=400, detail="Username already exists")
-
-    # Check if email already exists
-    existing_email = await db.execute(select(User).where(User.email == user.email))
-    if existing_email.scalar_one_or_none():
+    if conflicts:
         raise HTTPException(status_code=400, detail="Email already exists")
 
     # Create user
     db_user = User(
-        id=uuid.uuid4(),
         username=user.username,
         email=user.email,
         full_name=user.full_name,
-        hashed_password=hash_password(user.password),
+        hashed_password=await hash_password_async(user.password),
         is_active=user.is_active,
     )
     db.add(db_user)
@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
@@ -41,7 +41,7 @@ async def get_locations(
 
     query = query.offset(skip).limit(limit)
     result = await db.execute(query)
-    return result.scalars().all()
+    return [LocationSchema.from_orm_trusted(location) for location in result.scalars().all()]
 
 
 @router.get("/locations/{location_id}", response_model=LocationSchema)
@@ -57,7 +57,7 @@ async def get_location(
     if not location:
         raise HTTPException(status_code=404, detail="Location not found")
 
-    return location
+    return LocationSchema.from_orm_trusted(location)
 
 
 @router.post("/locations/", response_model=LocationSchema)
@@ -83,18 +83,17 @@ async def update_location(
     _: User = Depends(require_permissions("warehouse:update")),
 ):
     """Update location"""
-    result = await db.execute(select(Location).where(Location.id == location_id))
-    location = result.scalar_one_or_none()
+    update_data = location_update.model_dump(exclude_unset=True)
+    if update_data:
+        stmt = update(Location).where(Location.id == location_id).values(**update_data).returning(Location).execution_options(synchronize_session=False)
+    else:
+        stmt = select(Location).where(Location.id == location_id)
+    location = (await db.execute(stmt)).scalar_one_or_none()
 
     if not location:
         raise HTTPException(status_code=404, detail="Location not found")
 
-    update_data = location_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(location, field, value)
-
     await db.commit()
-    await db.refresh(location)
 
     return location
 
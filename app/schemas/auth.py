@@ -1,6 +1,6 @@
 import uuid
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, TypeAdapter
 
 
 class PermissionRead(BaseModel):
@@ -8,7 +8,13 @@ class PermissionRead(BaseModel):
     code: str
     description: str | None = None
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(
+        from_attributes=True,
+        frozen=True,
+        validate_assignment=False,
+        defer_build=False,
+        revalidate_instances="never",
+    )
 
 
 class RoleRead(BaseModel):
@@ -17,17 +23,33 @@ class RoleRead(BaseModel):
     description: str | None = None
     permissions: list[PermissionRead] = Field(default_factory=list)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(
+        from_attributes=True,
+        frozen=True,
+        validate_assignment=False,
+        defer_build=False,
+        revalidate_instances="never",
+    )
 
 
 class UserRead(BaseModel):
     id: uuid.UUID
     username: str
-    email: EmailStr
+    email: str
     is_active: bool
     roles: list[RoleRead] = Field(default_factory=list)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(
+        from_attributes=True,
+        frozen=True,
+        validate_assignment=False,
+        defer_build=False,
+        revalidate_instances="never",
+    )
+
+
+# Dibangun sekali saat import; dipakai router untuk serialisasi langsung ke JSON bytes.
+USER_READ_ADAPTER = TypeAdapter(UserRead)
 
 
 class UserCreate(BaseModel):
@@ -0,0 +1,153 @@
+"""Shared helpers for response schemas"""
+
+import enum
+import sys
+import types
+from collections.abc import Callable
+from functools import cache
+from operator import attrgetter
+from typing import Annotated, Any, Self, Union, get_args, get_origin
+
+from pydantic import AfterValidator, Field
+from pydantic_core import PydanticUndefined
+
+
+@cache
+def enum_value_str(enum_cls: type[enum.Enum]) -> Any:
+    """
+    Tipe `str` yang dibatasi ke value dari `enum_cls`.
+
+    Validasi cukup satu lookup dict (value string yang sudah di-intern) alih-alih enum
+    validator pydantic, dan hasilnya tetap string biasa yang siap disimpan ke kolom String.
+    """
+    interned = {value: sys.intern(value) for value in (member.value for member in enum_cls)}
+    allowed = ", ".join(interned)
+
+    def check(value: str) -> str:
+        try:
+            return interned[value]
+        except KeyError:
+            raise ValueError(f"must be one of: {allowed}") from None
+
+    return Annotated[str, AfterValidator(check), Field(json_schema_extra={"enum": list(interned)})]
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+@cache
+def _hydration_plan(cls: type) -> tuple[tuple[str, str, Any], ...]:
+    """Build (field_name, kind, target) once per schema class."""
+    plan = []
+    for name, field in cls.model_fields.items():
+        annotation = _unwrap_optional(field.annotation)
+        item = get_args(annotation)[0] if get_origin(annotation) is list else None
+
+        if isinstance(item, type) and issubclass(item, TrustedFromORM):
+            plan.append((name, "list", item))
+        elif isinstance(annotation, type) and issubclass(annotation, TrustedFromORM):
+            plan.append((name, "model", annotation))
+        elif isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+            plan.append((name, "enum", annotation))
+        else:
+            plan.append((name, "value", None))
+    return tuple(plan)
+
+
+@cache
+def _is_trusted(cls: type, source: type) -> bool:
+    """
+    True jika `cls` boleh di-hydrate dari instance `source` tanpa validasi, dihitung sekali per pasangan.
+
+    Tidak boleh jika ada field dengan constraint/validator (mis. `Field(ge=0)`) yang harus tetap
+    dicek, atau field required yang tidak punya atribut di ORM class (hasilnya melanggar schema).
+    """
+    return all(not field.metadata and (not field.is_required() or hasattr(source, name)) for name, field in cls.model_fields.items())
+
+
+@cache
+def _row_builder(cls: type, source: type) -> Callable[[Any], Any] | None:
+    """
+    Builder cepat untuk schema flat (tanpa nested TrustedFromORM) per pasangan (schema, ORM class).
+
+    Semua atribut diambil dengan satu `attrgetter` lalu instance diisi langsung lewat
+    `__dict__`, tanpa loop getattr per field dan tanpa `model_construct`.
+    """
+    plan = _hydration_plan(cls)
+    if any(kind in ("list", "model") for _, kind, _ in plan):
+        return None
+
+    names = tuple(name for name, _, _ in plan if hasattr(source, name))
+    if not names:
+        return None
+
+    enums = tuple((name, target) for name, kind, target in plan if kind == "enum" and name in names)
+    defaults = {name: field.default for name, field in cls.model_fields.items() if name not in names and field.default is not PydanticUndefined}
+    order = tuple(name for name in cls.model_fields if name in names or name in defaults)
+    getter = attrgetter(*names)
+    single = len(names) == 1
+
+    def build(obj: Any) -> Any:
+        values = getter(obj)
+        data = dict(zip(names, (values,) if single else values))
+        if defaults:
+            # Pertahankan urutan field schema agar output JSON tidak berubah
+            data = {name: data[name] if name in data else defaults[name] for name in order}
+        for name, target in enums:
+            value = data[name]
+            if value is not None and not isinstance(value, target):
+                data[name] = target(value)
+
+        instance = cls.__new__(cls)
+        object.__setattr__(instance, "__dict__", data)
+        object.__setattr__(instance, "__pydantic_fields_set__", set(names))
+        object.__setattr__(instance, "__pydantic_extra__", None)
+        object.__setattr__(instance, "__pydantic_private__", None)
+        return instance
+
+    return build
+
+
+class TrustedFromORM:
+    """
+    Mixin untuk response schema yang di-hydrate dari row SQLAlchemy.
+
+    Data dari DB sudah dibatasi oleh schema tabel, jadi `from_orm_trusted` memakai
+    `model_construct` (tanpa validator pydantic-core). Nested schema yang juga
+    TrustedFromORM dibangun lebih dulu agar parent tidak me-revalidasi children.
+    Schema dengan field ber-constraint, atau yang field required-nya tidak ada di ORM
+    class, tetap lewat `model_validate` (lihat `_is_trusted`).
+    Gunakan `model_validate` hanya untuk request body (*Create, *Update).
+    """
+
+    @classmethod
+    def from_orm_trusted(cls, obj: Any) -> Self:
+        if not _is_trusted(cls, type(obj)):
+            return cls.model_validate(obj, from_attributes=True)
+
+        build = _row_builder(cls, type(obj))
+        if build is not None:
+            return build(obj)
+
+        values: dict[str, Any] = {}
+        for name, kind, target in _hydration_plan(cls):
+            value = getattr(obj, name, PydanticUndefined)
+            if value is PydanticUndefined:
+                continue
+
+            if value is None:
+                pass
+            elif kind == "list":
+                value = [target.from_orm_trusted(child) for child in value]
+            elif kind == "model":
+                value = target.from_orm_trusted(value)
+            elif kind == "enum" and not isinstance(value, target):
+                value = target(value)
+            values[name] = value
+
+        return cls.model_construct(**values)
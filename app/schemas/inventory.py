@@ -3,7 +3,14 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+import msgspec
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from app.models.enums import RefType, TransactionType
+from app.schemas.base import TrustedFromORM, enum_value_str
+
+TransactionTypeStr = enum_value_str(TransactionType)
+RefTypeStr = enum_value_str(RefType)
 
 
 class StockBalanceBase(BaseModel):
@@ -20,7 +27,7 @@ class StockBalanceUpdate(BaseModel):
     current_qty: int | None = Field(None, ge=0)
 
 
-class StockBalance(StockBalanceBase):
+class StockBalance(StockBalanceBase, TrustedFromORM):
     last_updated: datetime
 
     model_config = ConfigDict(from_attributes=True)
@@ -30,8 +37,8 @@ class StockLedgerBase(BaseModel):
     product_id: UUID
     location_id: UUID
     qty: int = Field(ge=0)
-    transaction_type: str
-    ref_type: str | None = None
+    transaction_type: TransactionTypeStr
+    ref_type: RefTypeStr | None = None
     ref_id: UUID | None = None
     notes: str | None = None
 
@@ -40,7 +47,7 @@ class StockLedgerCreate(StockLedgerBase):
     pass
 
 
-class StockLedger(StockLedgerBase):
+class StockLedger(StockLedgerBase, TrustedFromORM):
     id: UUID
     created_at: datetime
     created_by: UUID | None = None
@@ -53,10 +60,14 @@ class StockMovementRequest(BaseModel):
     from_location_id: UUID | None = None
     to_location_id: UUID
     quantity: int = Field(gt=0)
-    transaction_type: str = "transfer"
+    transaction_type: TransactionTypeStr = "transfer"
     notes: str | None = None
 
 
+# Dibangun sekali saat import; body stock movement di-parse langsung dengan validate_json
+STOCK_MOVE_ADAPTER = TypeAdapter(StockMovementRequest)
+
+
 class StockMovementResponse(BaseModel):
     success: bool
     message: str
@@ -64,7 +75,26 @@ class StockMovementResponse(BaseModel):
     updated_balances: list[StockBalance] = []
 
 
-class InventoryReport(BaseModel):
+class InventoryReport(BaseModel, TrustedFromORM):
+    product_id: UUID
+    product_sku: str
+    product_name: str
+    location_id: UUID
+    location_name: str
+    current_qty: int
+    last_updated: datetime
+    total_value: float | None = None
+
+
+class InventoryReportDTO(msgspec.Struct, frozen=True, gc=False):
+    """
+    Versi output-only dari InventoryReport untuk report besar.
+
+    msgspec Struct (tanpa dict per-instance, tidak dilacak GC) yang di-encode langsung ke
+    JSON bytes; urutan field sama dengan kolom `_inventory_report_query` sehingga bisa
+    dibangun dengan `InventoryReportDTO(*row)`. Schema pydantic tetap dipakai untuk OpenAPI.
+    """
+
     product_id: UUID
     product_sku: str
     product_name: str
@@ -75,6 +105,47 @@ class InventoryReport(BaseModel):
     total_value: float | None = None
 
 
+class InventorySummaryDTO(msgspec.Struct, frozen=True, gc=False):
+    total_products: int
+    total_locations: int
+    total_stock_value: float | None
+    low_stock_items: int
+    out_of_stock_items: int
+    report_data: list[InventoryReportDTO]
+
+
+class StockLedgerDTO(msgspec.Struct, frozen=True, gc=False):
+    id: UUID
+    product_id: UUID
+    location_id: UUID
+    qty: int
+    transaction_type: str
+    ref_type: str | None
+    ref_id: UUID | None
+    created_at: datetime
+    created_by: UUID | None
+
+
+class StockBalanceDTO(msgspec.Struct, frozen=True, gc=False):
+    product_id: UUID
+    location_id: UUID
+    current_qty: int
+    last_updated: datetime
+
+
+class StockMovementResponseDTO(msgspec.Struct, frozen=True):
+    """Payload StockMovementResponse yang di-encode langsung oleh msgspec (UUID/datetime native)."""
+
+    success: bool
+    message: str
+    ledger_entries: list[StockLedgerDTO] = []
+    updated_balances: list[StockBalanceDTO] = []
+
+
+# Encoder dibuat sekali saat import
+INVENTORY_JSON_ENCODER = msgspec.json.Encoder()
+
+
 class InventorySummary(BaseModel):
     total_products: int
     total_locations: int
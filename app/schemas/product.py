@@ -4,6 +4,9 @@ from datetime import datetime
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.models.enums import ProductCategory
+from app.schemas.base import TrustedFromORM, enum_value_str
+
+Category = enum_value_str(ProductCategory)
 
 
 class ProductBase(BaseModel):
@@ -11,7 +14,7 @@ class ProductBase(BaseModel):
 
     sku: str = Field(..., min_length=1, max_length=50, description="Stock Keeping Unit")
     name: str = Field(..., min_length=1, max_length=255, description="Nama produk")
-    category: ProductCategory = Field(..., description="Kategori produk")
+    category: Category = Field(..., description="Kategori produk")
     uom: str = Field(..., min_length=1, max_length=20, description="Unit of Measure (pcs, kg, m, dll)")
     supplier_id: uuid.UUID | None = Field(None, description="ID supplier (jika ada)")
     customer_id: uuid.UUID | None = Field(None, description="ID customer (jika ada)")
@@ -29,14 +32,14 @@ class ProductUpdate(BaseModel):
 
     sku: str | None = Field(None, min_length=1, max_length=50)
     name: str | None = Field(None, min_length=1, max_length=255)
-    category: ProductCategory | None = None
+    category: Category | None = None
     uom: str | None = Field(None, min_length=1, max_length=20)
     supplier_id: uuid.UUID | None = None
     customer_id: uuid.UUID | None = None
     meta_data: dict | None = None
 
 
-class ProductResponse(ProductBase):
+class ProductResponse(ProductBase, TrustedFromORM):
     """Schema untuk response Product (include ID dan timestamps)"""
 
     id: uuid.UUID
@@ -46,7 +49,7 @@ class ProductResponse(ProductBase):
     model_config = ConfigDict(from_attributes=True)
 
 
-class ProductListItem(BaseModel):
+class ProductListItem(BaseModel, TrustedFromORM):
     """Schema simplified untuk list products"""
 
     id: uuid.UUID
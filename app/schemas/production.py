@@ -3,19 +3,26 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from app.models.enums import ProductionStatus
+from app.schemas.base import TrustedFromORM, enum_value_str
+
+ProductionStatusStr = enum_value_str(ProductionStatus)
 
 
 class WorkCenterBase(BaseModel):
-    code: str = Field(max_length=50)
-    name: str = Field(max_length=100)
+    code: str
+    name: str
     type: str
     capacity: int | None = Field(None, gt=0)
     is_active: bool = True
 
 
 class WorkCenterCreate(WorkCenterBase):
-    pass
+    # Batas panjang hanya untuk input; schema response memakai Base tanpa constraint
+    code: str = Field(max_length=50)
+    name: str = Field(max_length=100)
 
 
 class WorkCenterUpdate(BaseModel):
@@ -42,7 +49,7 @@ class BOMItemBase(BaseModel):
 
 
 class BOMItemCreate(BOMItemBase):
-    pass
+    model_config = ConfigDict(revalidate_instances="never", validate_assignment=False, extra="ignore")
 
 
 class BOMItem(BOMItemBase):
@@ -50,7 +57,8 @@ class BOMItem(BOMItemBase):
     bom_id: UUID
     created_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    # Leaf record read-only: frozen (hashable) dan tanpa extra field
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid", arbitrary_types_allowed=False)
 
 
 class BOMBase(BaseModel):
@@ -64,6 +72,13 @@ class BOMBase(BaseModel):
 class BOMCreate(BOMBase):
     items: list[BOMItemCreate]
 
+    # Body request divalidasi sekali oleh pydantic-core (parent + items dalam satu pass);
+    # instance yang sudah jadi tidak divalidasi/di-copy ulang.
+    model_config = ConfigDict(revalidate_instances="never", validate_assignment=False, extra="ignore")
+
+
+BOM_CREATE_ADAPTER = TypeAdapter(BOMCreate)
+
 
 class BOMUpdate(BaseModel):
     bom_name: str | None = None
@@ -80,7 +95,7 @@ class BOM(BOMBase):
 
 
 class ProductionOrderBase(BaseModel):
-    order_number: str = Field(max_length=50)
+    order_number: str
     product_id: UUID
     bom_id: UUID
     work_center_id: UUID | None = None
@@ -94,18 +109,18 @@ class ProductionOrderBase(BaseModel):
 
 
 class ProductionOrderCreate(ProductionOrderBase):
-    pass
+    order_number: str = Field(max_length=50)
 
 
 class ProductionOrderUpdate(BaseModel):
-    status: str | None = None
+    status: ProductionStatusStr | None = None
     qty_produced: int | None = Field(None, ge=0)
     start_date: datetime | None = None
     end_date: datetime | None = None
     notes: str | None = None
 
 
-class ProductionOrder(ProductionOrderBase):
+class ProductionOrder(ProductionOrderBase, TrustedFromORM):
     id: UUID
     qty_produced: int = Field(ge=0)
     status: str
@@ -3,12 +3,17 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from app.models.enums import POStatus
+from app.schemas.base import TrustedFromORM, enum_value_str
+
+POStatusStr = enum_value_str(POStatus)
 
 
 class SupplierBase(BaseModel):
-    code: str = Field(max_length=50)
-    name: str = Field(max_length=255)
+    code: str
+    name: str
     contact_person: str | None = None
     email: str | None = None
     phone: str | None = None
@@ -17,7 +22,9 @@ class SupplierBase(BaseModel):
 
 
 class SupplierCreate(SupplierBase):
-    pass
+    # Batas panjang hanya untuk input; schema response memakai Base tanpa constraint
+    code: str = Field(max_length=50)
+    name: str = Field(max_length=255)
 
 
 class SupplierUpdate(BaseModel):
@@ -46,22 +53,23 @@ class PurchaseOrderItemBase(BaseModel):
 
 
 class PurchaseOrderItemCreate(PurchaseOrderItemBase):
-    pass
+    model_config = ConfigDict(revalidate_instances="never", validate_assignment=False, extra="ignore")
 
 
-class PurchaseOrderItem(PurchaseOrderItemBase):
+class PurchaseOrderItem(PurchaseOrderItemBase, TrustedFromORM):
     id: UUID
     purchase_order_id: UUID
     received_quantity: int = Field(ge=0)
     created_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    # Leaf record read-only: frozen (hashable) dan tanpa extra field
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid", arbitrary_types_allowed=False)
 
 
 class PurchaseOrderBase(BaseModel):
-    po_number: str = Field(max_length=50)
+    po_number: str
     supplier_id: UUID
-    status: str
+    status: POStatusStr
     order_date: datetime
     expected_date: datetime | None = None
     total_amount: float = Field(ge=0)
@@ -69,16 +77,24 @@ class PurchaseOrderBase(BaseModel):
 
 
 class PurchaseOrderCreate(PurchaseOrderBase):
+    po_number: str = Field(max_length=50)
     items: list[PurchaseOrderItemCreate]
 
+    # Body request divalidasi sekali oleh pydantic-core (parent + items dalam satu pass);
+    # instance yang sudah jadi tidak divalidasi/di-copy ulang.
+    model_config = ConfigDict(revalidate_instances="never", validate_assignment=False, extra="ignore")
+
+
+PURCHASE_ORDER_CREATE_ADAPTER = TypeAdapter(PurchaseOrderCreate)
+
 
 class PurchaseOrderUpdate(BaseModel):
-    status: str | None = None
+    status: POStatusStr | None = None
     expected_date: datetime | None = None
     notes: str | None = None
 
 
-class PurchaseOrder(PurchaseOrderBase):
+class PurchaseOrder(PurchaseOrderBase, TrustedFromORM):
     id: UUID
     created_by: UUID | None = None
     created_at: datetime
@@ -1,30 +1,55 @@
 from __future__ import annotations
 
 from datetime import datetime
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Annotated, Any
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, computed_field, model_validator
+
+from app.models.enums import SOStatus
+from app.schemas.base import TrustedFromORM, enum_value_str
+
+SOStatusStr = enum_value_str(SOStatus)
+
+# `unit_price` desimal dari client lama, sebelum dikonversi ke integer sen
+_UNIT_PRICE_ADAPTER = TypeAdapter(Annotated[Decimal, Field(ge=0)])
 
 
 class SalesOrderItemBase(BaseModel):
     product_id: UUID
     quantity: int = Field(gt=0)
-    unit_price: Decimal = Field(ge=0)
+    # Harga disimpan sebagai integer sen (kolom Numeric(15, 2)); Decimal hanya saat serialisasi
+    unit_price_cents: int = Field(ge=0)
     notes: str | None = None
 
+    @model_validator(mode="before")
+    @classmethod
+    def _unit_price_to_cents(cls, data: Any) -> Any:
+        """Tetap terima `unit_price` (Decimal); dibulatkan ke sen seperti kolom Numeric(15, 2)."""
+        if isinstance(data, dict) and "unit_price_cents" not in data and "unit_price" in data:
+            price = _UNIT_PRICE_ADAPTER.validate_python(data["unit_price"])
+            data = {**data, "unit_price_cents": int(price.scaleb(2).quantize(Decimal(1), ROUND_HALF_UP))}
+        return data
+
+    @computed_field
+    @property
+    def unit_price(self) -> Decimal:
+        return Decimal(self.unit_price_cents).scaleb(-2)
+
 
 class SalesOrderItemCreate(SalesOrderItemBase):
-    pass
+    model_config = ConfigDict(revalidate_instances="never", validate_assignment=False, extra="ignore")
 
 
-class SalesOrderItemRead(SalesOrderItemBase):
+class SalesOrderItemRead(SalesOrderItemBase, TrustedFromORM):
     id: UUID
     so_id: UUID
     qty_ordered: int
     qty_delivered: int
 
-    model_config = ConfigDict(from_attributes=True)
+    # Leaf record read-only: frozen (hashable) dan tanpa extra field
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid", arbitrary_types_allowed=False)
 
 
 class SalesOrderBase(BaseModel):
@@ -36,20 +61,27 @@ class SalesOrderBase(BaseModel):
 
 class SalesOrderCreate(SalesOrderBase):
     so_number: str | None = None
-    status: str = "draft"
+    status: SOStatusStr = "draft"
     expected_date: datetime | None = None
     items: list[SalesOrderItemCreate]
 
+    # Body request divalidasi sekali oleh pydantic-core (parent + items dalam satu pass);
+    # instance yang sudah jadi tidak divalidasi/di-copy ulang.
+    model_config = ConfigDict(revalidate_instances="never", validate_assignment=False, extra="ignore")
+
+
+SALES_ORDER_CREATE_ADAPTER = TypeAdapter(SalesOrderCreate)
+
 
 class SalesOrderUpdate(BaseModel):
     customer_id: UUID | None = None
     order_date: datetime | None = None
     delivery_date: datetime | None = None
     notes: str | None = None
-    status: str | None = None
+    status: SOStatusStr | None = None
 
 
-class SalesOrderRead(SalesOrderBase):
+class SalesOrderRead(SalesOrderBase, TrustedFromORM):
     id: UUID
     so_number: str
     customer_id: UUID
@@ -57,13 +89,22 @@ class SalesOrderRead(SalesOrderBase):
     delivery_date: datetime
     status: str
     notes: str | None
-    total_amount: Decimal
+    total_amount_cents: int
     created_by: UUID | None
     created_at: datetime
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
 
+    @computed_field
+    @property
+    def total_amount(self) -> Decimal:
+        return Decimal(self.total_amount_cents).scaleb(-2)
+
+
+# Dibangun sekali saat import; memvalidasi seluruh list dalam satu pass pydantic-core
+SALES_ORDER_READ_LIST_ADAPTER = TypeAdapter(list[SalesOrderRead])
+
 
 class SalesOrderList(BaseModel):
     sales_orders: list[SalesOrderRead]
@@ -1,30 +1,49 @@
 """Pydantic schemas for user management"""
 
+import re
 from datetime import datetime
+from typing import Annotated
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from pydantic import AfterValidator, BaseModel, ConfigDict, EmailStr, Field
+
+from app.schemas.base import TrustedFromORM
+
+_EMAIL_RE = re.compile(r"^[^\s@]+@[^\s@]+\.[^\s@]+$")
+
+
+def _validate_email(value: str) -> str:
+    if not _EMAIL_RE.match(value):
+        raise ValueError("value is not a valid email address")
+    return value
+
+
+# Cek format ringan tanpa email-validator; EmailStr hanya dipakai untuk UserCreate
+Email = Annotated[str, AfterValidator(_validate_email)]
 
 
 class UserBase(BaseModel):
-    username: str = Field(max_length=50)
-    email: EmailStr
+    username: str
+    email: str
     full_name: str | None = None
     is_active: bool = True
 
 
 class UserCreate(UserBase):
+    # Batas panjang hanya untuk input; schema response memakai Base tanpa constraint
+    username: str = Field(max_length=50)
+    email: EmailStr
     password: str = Field(min_length=8)
 
 
 class UserUpdate(BaseModel):
     username: str | None = Field(None, max_length=50)
-    email: EmailStr | None = None
+    email: Email | None = None
     full_name: str | None = None
     is_active: bool | None = None
 
 
-class User(UserBase):
+class User(UserBase, TrustedFromORM):
     id: UUID
     created_at: datetime
     updated_at: datetime
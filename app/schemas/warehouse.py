@@ -5,17 +5,21 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.schemas.base import TrustedFromORM
+
 
 class LocationBase(BaseModel):
-    code: str = Field(max_length=50)
-    name: str = Field(max_length=100)
+    code: str
+    name: str
     type: str
     parent_id: UUID | None = None
     is_active: bool = True
 
 
 class LocationCreate(LocationBase):
-    pass
+    # Batas panjang hanya untuk input; schema response memakai Base tanpa constraint
+    code: str = Field(max_length=50)
+    name: str = Field(max_length=100)
 
 
 class LocationUpdate(BaseModel):
@@ -26,7 +30,7 @@ class LocationUpdate(BaseModel):
     is_active: bool | None = None
 
 
-class Location(LocationBase):
+class Location(LocationBase, TrustedFromORM):
     id: UUID
     created_at: datetime
     updated_at: datetime
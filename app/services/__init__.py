@@ -1,11 +1,23 @@
-from .bootstrap import (
-    BootstrapError,
-    bootstrap_admin_user,
-    seed_rbac,
-)
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .bootstrap import (
+        BootstrapError,
+        bootstrap_admin_user,
+        seed_rbac,
+    )
 
 __all__ = [
     "BootstrapError",
     "bootstrap_admin_user",
     "seed_rbac",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy re-export (PEP 562): `import app.services.<modul>` tidak ikut memuat bootstrap
+    if name in __all__:
+        from . import bootstrap
+
+        return getattr(bootstrap, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,9 +1,14 @@
-from sqlalchemy import or_, select
+import sys
+import uuid
+
+from sqlalchemy import literal, or_, select, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.core.security import hash_password
-from app.models import Permission, Role, User
+from app.core.cache import invalidate
+from app.core.security import hash_password_async
+from app.models import Permission, Role, User, role_permissions
 
 PERMISSION_CATALOG: dict[str, list[str]] = {
     "products": ["create", "read", "update", "delete"],
@@ -15,31 +20,37 @@ PERMISSION_CATALOG: dict[str, list[str]] = {
     "roles": ["create", "read", "update", "delete", "assign_permissions"],
 }
 
-ROLE_PERMISSION_MAP: dict[str, set[str]] = {
-    "super_admin": {f"{module}:{action}" for module, actions in PERMISSION_CATALOG.items() for action in actions},
-    "admin": {f"{module}:{action}" for module, actions in PERMISSION_CATALOG.items() for action in actions if not (module == "users" and action == "delete")},
-    "manager": {
-        "products:create",
-        "products:read",
-        "products:update",
-        "inventory:read",
-        "inventory:adjust",
-        "purchasing:create",
-        "purchasing:read",
-        "purchasing:update",
-        "purchasing:approve",
-        "sales:create",
-        "sales:read",
-        "sales:update",
-        "sales:approve",
-        "production:create",
-        "production:read",
-        "production:update",
-        "production:release",
-        "users:read",
-        "roles:read",
-    },
-    "viewer": {f"{module}:read" for module in PERMISSION_CATALOG},
+# Dihitung sekali saat import; string di-intern agar perbandingan dict/set cukup via pointer.
+_ALL_PERMISSION_CODES: tuple[str, ...] = tuple(sys.intern(f"{module}:{action}") for module, actions in PERMISSION_CATALOG.items() for action in actions)
+_ALL_PERMISSION_CODES_SET: frozenset[str] = frozenset(_ALL_PERMISSION_CODES)
+
+ROLE_PERMISSION_MAP: dict[str, frozenset[str]] = {
+    "super_admin": _ALL_PERMISSION_CODES_SET,
+    "admin": _ALL_PERMISSION_CODES_SET - {"users:delete"},
+    "manager": frozenset(
+        {
+            "products:create",
+            "products:read",
+            "products:update",
+            "inventory:read",
+            "inventory:adjust",
+            "purchasing:create",
+            "purchasing:read",
+            "purchasing:update",
+            "purchasing:approve",
+            "sales:create",
+            "sales:read",
+            "sales:update",
+            "sales:approve",
+            "production:create",
+            "production:read",
+            "production:update",
+            "production:release",
+            "users:read",
+            "roles:read",
+        }
+    ),
+    "viewer": frozenset(code for code in _ALL_PERMISSION_CODES if code.endswith(":read")),
 }
 
 ROLE_DESCRIPTIONS: dict[str, str] = {
@@ -54,8 +65,8 @@ class BootstrapError(Exception):
     pass
 
 
-def _all_permission_codes() -> list[str]:
-    return [f"{module}:{action}" for module, actions in PERMISSION_CATALOG.items() for action in actions]
+def _all_permission_codes() -> tuple[str, ...]:
+    return _ALL_PERMISSION_CODES
 
 
 async def seed_rbac(db: AsyncSession) -> dict[str, int]:
@@ -67,50 +78,44 @@ async def seed_rbac(db: AsyncSession) -> dict[str, int]:
 
     all_codes = _all_permission_codes()
 
-    existing_permissions = {permission.code: permission for permission in (await db.scalars(select(Permission).where(Permission.code.in_(all_codes)))).all()}
+    # Permission dan role yang sudah ada diambil dalam satu round trip (UNION ALL);
+    # seed hanya butuh id-nya untuk membuat link, bukan object ORM lengkap.
+    prefetch = union_all(
+        select(literal("permission").label("kind"), Permission.code.label("key"), Permission.id).where(Permission.code.in_(all_codes)),
+        select(literal("role"), Role.name, Role.id).where(Role.name.in_(tuple(ROLE_PERMISSION_MAP))),
+    )
+    permission_ids: dict[str, uuid.UUID] = {}
+    role_ids: dict[str, uuid.UUID] = {}
+    for kind, key, row_id in await db.execute(prefetch):
+        (permission_ids if kind == "permission" else role_ids)[key] = row_id
 
+    new_permissions: dict[str, Permission] = {}
     for code in all_codes:
-        if code not in existing_permissions:
+        if code not in permission_ids:
             module, action = code.split(":", 1)
-            permission = Permission(
+            new_permissions[code] = Permission(
                 code=code,
                 description=f"Can {action} in {module} module",
             )
-            db.add(permission)
-            existing_permissions[code] = permission
-            summary["permissions_created"] += 1
-
-    await db.flush()
 
-    roles = {role.name: role for role in (await db.scalars(select(Role).options(selectinload(Role.permissions)))).all()}
-
-    for role_name, permission_codes in ROLE_PERMISSION_MAP.items():
-        role = roles.get(role_name)
-        if role is None:
-            role = Role(
-                name=role_name,
-                description=ROLE_DESCRIPTIONS.get(role_name),
-            )
-            db.add(role)
-            roles[role_name] = role
-            summary["roles_created"] += 1
+    new_roles: dict[str, Role] = {role_name: Role(name=role_name, description=ROLE_DESCRIPTIONS.get(role_name)) for role_name in ROLE_PERMISSION_MAP if role_name not in role_ids}
 
+    db.add_all([*new_permissions.values(), *new_roles.values()])
     await db.flush()
 
-    # Load roles with permissions to avoid lazy loading issues
-    result = await db.execute(select(Role).options(selectinload(Role.permissions)))
-    loaded_roles = {role.name: role for role in result.scalars()}
+    permission_ids.update((code, permission.id) for code, permission in new_permissions.items())
+    role_ids.update((role_name, role.id) for role_name, role in new_roles.items())
+    summary["permissions_created"] = len(new_permissions)
+    summary["roles_created"] = len(new_roles)
 
-    for role_name, permission_codes in ROLE_PERMISSION_MAP.items():
-        role = loaded_roles[role_name]
-        current_codes = {permission.code for permission in role.permissions}
-        missing_codes = permission_codes - current_codes
-
-        for code in sorted(missing_codes):
-            role.permissions.append(existing_permissions[code])
-            summary["role_permission_links_added"] += 1
+    # Semua link role-permission dalam satu INSERT; link yang sudah ada di-skip oleh
+    # ON CONFLICT dan RETURNING hanya mengembalikan baris yang benar-benar ditambahkan.
+    link_rows = [{"role_id": role_ids[role_name], "permission_id": permission_ids[code]} for role_name, permission_codes in ROLE_PERMISSION_MAP.items() for code in sorted(permission_codes)]
+    inserted_links = await db.execute(pg_insert(role_permissions).values(link_rows).on_conflict_do_nothing().returning(role_permissions.c.role_id))
+    summary["role_permission_links_added"] = len(inserted_links.all())
 
     await db.commit()
+    await invalidate("permissions", "roles")
     return summary
 
 
@@ -136,15 +141,14 @@ async def bootstrap_admin_user(
     user = User(
         username=username,
         email=email,
-        hashed_password=hash_password(password),
+        hashed_password=await hash_password_async(password),
         is_active=True,
         roles=[role],
     )
     db.add(user)
     await db.commit()
 
-    created_user = await db.scalar(select(User).options(selectinload(User.roles).selectinload(Role.permissions)).where(User.id == user.id))
-    if created_user is None:
-        raise BootstrapError("Failed to create bootstrap admin user")
-
-    return created_user
+    # Role + permissions sudah ter-load di atas dan session expire_on_commit=False,
+    # jadi cukup ambil kolom yang di-generate DB tanpa SELECT ulang seluruh graph.
+    await db.refresh(user, attribute_names=["id", "created_at", "updated_at"])
+    return user
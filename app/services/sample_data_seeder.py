@@ -6,10 +6,12 @@ Creates interconnected sample data across all modules for testing and demonstrat
 import uuid
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
-from typing import Any, Optional
+from typing import Any, NamedTuple, Optional
 
+from sqlalchemy import cast, column, insert, select, text, true, values
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import invalidate
 from app.database import SessionLocal
 from app.models import (
     BOM,
@@ -29,8 +31,85 @@ from app.models import (
     WorkCenter,
 )
 
+# Offset tanggal sales order sample
+_SO1_ORDER_AGE = timedelta(days=5)
+_SO1_LEAD_TIME = timedelta(days=10)
+_SO2_ORDER_AGE = timedelta(days=2)
+_SO2_LEAD_TIME = timedelta(days=30)
+
+
+class ProductRef(NamedTuple):
+    """Ref produk ringan hasil `find_product_by_sku`."""
+
+    id: uuid.UUID
+
+
+# Statement raw SQL dibuat sekali di level modul, bukan per pemanggilan
+# Stok awal per kategori: (category, offset bin awal, kelipatan qty)
+_INITIAL_STOCK_PLAN = (("material", 0, 100), ("parts", 3, 50))
+
+# Satu statement untuk semua entry plan (bukan executemany per kategori): product id semua
+# kategori dalam satu array, `plans` menunjuk entry plan (1-based) milik tiap produk.
+# SQL-nya statis; semua nilai lewat bind parameter.
+_INSERT_STOCK_LEDGER = text(
+    """
+    INSERT INTO stock_ledgers (id, product_id, location_id, qty, transaction_type, ref_type, ref_id, created_by)
+    SELECT
+        gen_random_uuid(),
+        p.product_id,
+        (CAST(:bin_ids AS uuid[]))[(p.rn - 1 + (CAST(:bin_offsets AS integer[]))[p.plan]) % :bin_count + 1],
+        p.rn * (CAST(:qty_steps AS integer[]))[p.plan],
+        'purchase',
+        'purchase_order_item',
+        gen_random_uuid(),
+        NULL
+    FROM (
+        SELECT u.product_id, u.plan, row_number() OVER (PARTITION BY u.plan ORDER BY u.ord) AS rn
+        FROM unnest(CAST(:product_ids AS uuid[]), CAST(:plans AS integer[])) WITH ORDINALITY AS u(product_id, plan, ord)
+    ) AS p
+    """
+)
+
+_INSERT_SALES_ORDER = text(
+    """
+    INSERT INTO sales_orders (
+        id,
+        so_number,
+        customer_id,
+        order_date,
+        delivery_date,
+        status,
+        notes,
+        created_by
+    )
+    VALUES (
+        :id,
+        :so_number,
+        :customer_id,
+        :order_date,
+        :delivery_date,
+        :status,
+        :notes,
+        :created_by
+    )
+    """
+)
+
+# Khusus seeding/demo (data bisa di-generate ulang): commit tidak menunggu fsync WAL.
+# Jangan dipakai di code aplikasi biasa. SET LOCAL hanya berlaku sampai akhir transaksi.
+_RELAX_COMMIT_DURABILITY = text("SET LOCAL synchronous_commit = off")
+
+_COUNT_STOCK = text("SELECT (SELECT COUNT(*) FROM stock_balances) AS sb, (SELECT COUNT(*) FROM stock_ledgers) AS sl")
+
 
 class SampleDataSeeder:
+    """
+    Seeder sample data lintas modul.
+
+    Semua data di-seed berurutan dalam satu transaksi `db` milik caller: gagal di tengah
+    berarti rollback penuh, tidak ada seed setengah jadi.
+    """
+
     def __init__(self, db: AsyncSession):
         self.db = db
         self.data: dict[str, Any] = {
@@ -44,11 +123,37 @@ class SampleDataSeeder:
             "purchase_orders": [],
             "sales_orders": [],
             "sales_order_items": [],
+            "stock_balances": [],
+            "stock_ledgers": [],
+            "production_orders": [],
         }
+        # Index code -> location id, diisi setiap kali locations di-insert
+        self._location_by_code: dict[str, uuid.UUID] = {}
+        # SKU -> product id dan SKU produk jadi -> BOM id, diisi saat insert (tanpa SELECT ulang)
+        self._product_id_by_sku: dict[str, uuid.UUID] = {}
+        self._product_ids_by_category: dict[str, list[uuid.UUID]] = {}
+        self._bom_id_by_product_sku: dict[str, uuid.UUID] = {}
+
+    async def _bulk_insert(self, model: Any, rows: list[dict[str, Any]]) -> list[uuid.UUID]:
+        """
+        Batch INSERT (executemany) tanpa RETURNING.
+
+        Primary key di-generate di client, jadi cukup satu INSERT per tabel. Yang dikembalikan
+        hanya daftar `id` sesuai urutan `rows`, tidak ada instance ORM yang ditahan session.
+        """
+        # Samakan key set semua row agar tetap satu batch (key yang tidak ada diisi NULL)
+        keys = dict.fromkeys(["id", *(key for row in rows for key in row)])
+        rows = [{key: row.get(key) for key in keys} | {"id": row.get("id") or uuid.uuid4()} for row in rows]
+        await self.db.execute(insert(model), rows)
+        return [row["id"] for row in rows]
 
     async def seed_all(self) -> dict[str, int]:
         """Seed all sample data in proper order to maintain relationships"""
         summary = {}
+        # Tanpa flush di antara grup: semua PK dibuat di client (uuid4), jadi FK child sudah
+        # diketahui sebelum parent di-insert. FK di skema tidak DEFERRABLE, jadi urutan insert
+        # parent -> child tetap dipertahankan (SET CONSTRAINTS ALL DEFERRED tidak berefek).
+        await self.db.execute(_RELAX_COMMIT_DURABILITY)
 
         # 1. Master Data (no dependencies)
         await self.seed_suppliers()
@@ -71,21 +176,16 @@ class SampleDataSeeder:
 
         # 5. BOMs and BOM Items (depends on products and work centers)
         await self.seed_boms()
-        summary["boms"] = 2  # Hardcoded since we're not storing them
-        summary["bom_items"] = 4  # Hardcoded since we're not storing them
+        summary["boms"] = len(self.data["boms"])
+        summary["bom_items"] = len(self.data["bom_items"])
 
         # 6. Initial Stock Balances (depends on products and locations)
         await self.seed_initial_stock()
 
-        # Count actual stock balances created by trigger
-        from sqlalchemy import text
-
-        balance_count = await self.db.execute(text("SELECT COUNT(*) FROM stock_balances"))
-        summary["stock_balances"] = int(balance_count.scalar() or 0)
-
-        # Count stock ledgers created
-        ledger_count = await self.db.execute(text("SELECT COUNT(*) FROM stock_ledgers"))
-        summary["stock_ledgers"] = int(ledger_count.scalar() or 0)
+        # Count actual stock balances created by trigger + stock ledgers created, in one round trip
+        counts = (await self.db.execute(_COUNT_STOCK)).one()
+        summary["stock_balances"] = int(counts.sb)
+        summary["stock_ledgers"] = int(counts.sl)
 
         # 7. Purchase Orders (depends on suppliers and products)
         await self.seed_purchase_orders()
@@ -94,7 +194,7 @@ class SampleDataSeeder:
 
         # 8. Sales Orders (depends on customers and products)
         await self.seed_sales_orders()
-        summary["sales_orders"] = 2  # Hardcoded since we're using raw SQL
+        summary["sales_orders"] = len(self.data["sales_orders"])
         summary["sales_order_items"] = len(self.data["sales_order_items"])
 
         # 9. Production Orders (depends on products, BOMs, and Sales Orders)
@@ -102,6 +202,8 @@ class SampleDataSeeder:
         summary["production_orders"] = len(self.data["production_orders"])
 
         await self.db.commit()
+        # Customer/product aktif di-cache oleh router sales; buang agar data baru langsung terlihat
+        await invalidate("sales:customers", "sales:products")
         return summary
 
     async def seed_suppliers(self) -> None:
@@ -139,13 +241,7 @@ class SampleDataSeeder:
             },
         ]
 
-        self.data["suppliers"] = []
-        for supplier_data in suppliers_data:
-            supplier = Supplier(**supplier_data)
-            self.db.add(supplier)
-            self.data["suppliers"].append(supplier)
-
-        await self.db.flush()
+        self.data["suppliers"] = await self._bulk_insert(Supplier, suppliers_data)
 
     async def seed_customers(self) -> None:
         """Create sample customers"""
@@ -182,13 +278,7 @@ class SampleDataSeeder:
             },
         ]
 
-        self.data["customers"] = []
-        for customer_data in customers_data:
-            customer = Customer(**customer_data)
-            self.db.add(customer)
-            self.data["customers"].append(customer)
-
-        await self.db.flush()
+        self.data["customers"] = await self._bulk_insert(Customer, customers_data)
 
     async def seed_locations(self) -> None:
         """Create hierarchical locations (Warehouse → Zone → Bin)"""
@@ -217,13 +307,8 @@ class SampleDataSeeder:
         ]
 
         # Create parent locations first
-        self.data["locations"] = []
-        for loc_data in locations_data:
-            location = Location(**loc_data)
-            self.db.add(location)
-            self.data["locations"].append(location)
-
-        await self.db.flush()
+        self.data["locations"] = await self._bulk_insert(Location, locations_data)
+        self._location_by_code.update(zip((row["code"] for row in locations_data), self.data["locations"]))
 
         # Create zones and bins under each parent
         zone_mapping = {
@@ -244,19 +329,20 @@ class SampleDataSeeder:
         }
 
         # Create zones
-        for parent_code, zones in zone_mapping.items():
-            parent = self.find_location_by_code(parent_code)
-            for zone_data in zones:
-                zone = Location(
-                    code=zone_data["code"],
-                    name=zone_data["name"],
-                    type="warehouse",  # Zones are treated as warehouse type
-                    parent_id=parent.id,
-                )
-                self.db.add(zone)
-                self.data["locations"].append(zone)
-
-        await self.db.flush()
+        zone_rows = [
+            {
+                "code": zone_data["code"],
+                "name": zone_data["name"],
+                "type": "warehouse",  # Zones are treated as warehouse type
+                "parent_id": self.find_location_by_code(parent_code),
+            }
+            for parent_code, zones in zone_mapping.items()
+            for zone_data in zones
+        ]
+
+        created_zones = await self._bulk_insert(Location, zone_rows)
+        self.data["locations"] += created_zones
+        self._location_by_code.update(zip((row["code"] for row in zone_rows), created_zones))
 
         # Create bins under zones
         bin_mapping = {
@@ -270,19 +356,20 @@ class SampleDataSeeder:
             "ST001-GR": ["ST001-GR-01"],
         }
 
-        for zone_code, bins in bin_mapping.items():
-            zone = self.find_location_by_code(zone_code)
-            for i, bin_code in enumerate(bins):
-                bin_loc = Location(
-                    code=bin_code,
-                    name=f"Bin {i + 1}",
-                    type="warehouse",
-                    parent_id=zone.id,
-                )
-                self.db.add(bin_loc)
-                self.data["locations"].append(bin_loc)
+        bin_rows = [
+            {
+                "code": bin_code,
+                "name": f"Bin {i + 1}",
+                "type": "warehouse",
+                "parent_id": self.find_location_by_code(zone_code),
+            }
+            for zone_code, bins in bin_mapping.items()
+            for i, bin_code in enumerate(bins)
+        ]
 
-        await self.db.flush()
+        created_bins = await self._bulk_insert(Location, bin_rows)
+        self.data["locations"] += created_bins
+        self._location_by_code.update(zip((row["code"] for row in bin_rows), created_bins))
 
     async def seed_products(self) -> None:
         """Create sample products with different categories"""
@@ -293,7 +380,7 @@ class SampleDataSeeder:
                 "name": "Steel Plate 10mm",
                 "category": "material",
                 "uom": "pcs",
-                "supplier_id": self.data["suppliers"][0].id,
+                "supplier_id": self.data["suppliers"][0],
                 "meta_data": {
                     "specifications": "10mm thickness",
                     "weight_kg": 78.5,
@@ -305,7 +392,7 @@ class SampleDataSeeder:
                 "name": "ABS Plastic Granules",
                 "category": "material",
                 "uom": "kg",
-                "supplier_id": self.data["suppliers"][1].id,
+                "supplier_id": self.data["suppliers"][1],
                 "meta_data": {"color": "black", "density": "1.04 g/cm3", "melt_flow": "20 g/10min"},
             },
             {
@@ -313,7 +400,7 @@ class SampleDataSeeder:
                 "name": "Electronic Circuit Board",
                 "category": "material",
                 "uom": "pcs",
-                "supplier_id": self.data["suppliers"][2].id,
+                "supplier_id": self.data["suppliers"][2],
                 "meta_data": {"type": "PCB", "layers": 4, "thickness": "1.6mm"},
             },
             # Parts
@@ -322,7 +409,7 @@ class SampleDataSeeder:
                 "name": "Electric Motor 5HP",
                 "category": "parts",
                 "uom": "pcs",
-                "supplier_id": self.data["suppliers"][1].id,
+                "supplier_id": self.data["suppliers"][1],
                 "meta_data": {"power": "5HP", "voltage": "380V", "rpm": 1450},
             },
             {
@@ -330,7 +417,7 @@ class SampleDataSeeder:
                 "name": "Spur Gear Module 2",
                 "category": "parts",
                 "uom": "pcs",
-                "supplier_id": self.data["suppliers"][0].id,
+                "supplier_id": self.data["suppliers"][0],
                 "meta_data": {"module": 2, "teeth": 30, "material": "Steel 45C"},
             },
             # Work in Progress
@@ -350,7 +437,7 @@ class SampleDataSeeder:
                 "name": "Industrial Water Pump 10HP",
                 "category": "finished_good",
                 "uom": "unit",
-                "customer_id": self.data["customers"][0].id,
+                "customer_id": self.data["customers"][0],
                 "meta_data": {
                     "power": "10HP",
                     "flow_rate": "500 L/min",
@@ -363,7 +450,7 @@ class SampleDataSeeder:
                 "name": "Conveyor Belt System",
                 "category": "finished_good",
                 "uom": "unit",
-                "customer_id": self.data["customers"][1].id,
+                "customer_id": self.data["customers"][1],
                 "meta_data": {
                     "length": "10m",
                     "width": "1m",
@@ -373,13 +460,10 @@ class SampleDataSeeder:
             },
         ]
 
-        self.data["products"] = []
-        for product_data in products_data:
-            product = Product(**product_data)
-            self.db.add(product)
-            self.data["products"].append(product)
-
-        await self.db.flush()
+        self.data["products"] = await self._bulk_insert(Product, products_data)
+        self._product_id_by_sku = dict(zip((row["sku"] for row in products_data), self.data["products"]))
+        for row, product_id in zip(products_data, self.data["products"]):
+            self._product_ids_by_category.setdefault(row["category"], []).append(product_id)
 
     async def seed_work_centers(self) -> None:
         """Create sample work centers"""
@@ -411,66 +495,57 @@ class SampleDataSeeder:
             },
         ]
 
-        self.data["work_centers"] = []
-        for wc_data in work_centers_data:
-            work_center = WorkCenter(**wc_data)
-            self.db.add(work_center)
-            self.data["work_centers"].append(work_center)
-
-        await self.db.flush()
+        self.data["work_centers"] = await self._bulk_insert(WorkCenter, work_centers_data)
 
     # Helper function to safely find location by code
     def find_location_by_code(self, code: str):
-        for location in self.data["locations"]:
-            if location.code == code:
-                return location
-        raise ValueError(f"Location with code {code} not found")
+        try:
+            return self._location_by_code[code]
+        except KeyError:
+            raise ValueError(f"Location with code {code} not found") from None
 
     # Helper function to safely find product by SKU
-    async def find_product_by_sku(self, sku: str):
-        # Use raw SQL to avoid ORM enum validation issues
-        from sqlalchemy import text
-
-        result = await self.db.execute(text("SELECT id FROM products WHERE sku = :sku"), {"sku": sku})
-        product_id = result.scalar_one_or_none()
+    async def find_product_by_sku(self, sku: str) -> ProductRef:
+        product_id = self._product_id_by_sku.get(sku)
         if product_id is None:
             raise ValueError(f"Product with SKU {sku} not found")
 
-        # Return a simple object with just the id
-        class ProductRef:
-            def __init__(self, id):
-                self.id = id
-
         return ProductRef(product_id)
 
     # Helper function to safely find BOM by product SKU
     async def find_bom_by_product_sku(self, sku: str):
-        # Use raw SQL to avoid ORM enum validation issues
-        from sqlalchemy import text
-
-        # Find the product ID first
-        product_result = await self.db.execute(text("SELECT id FROM products WHERE sku = :sku"), {"sku": sku})
-        product_id = product_result.scalar_one_or_none()
-        if not product_id:
+        if sku not in self._product_id_by_sku:
             raise ValueError(f"Product with SKU {sku} not found")
 
-        # Find the BOM for this product
-        bom_result = await self.db.execute(text("SELECT id FROM boms WHERE product_id = :product_id"), {"product_id": product_id})
-        bom_id = bom_result.scalar_one_or_none()
-        if not bom_id:
+        bom_id = self._bom_id_by_product_sku.get(sku)
+        if bom_id is None:
             raise ValueError(f"BOM for product with SKU {sku} not found")
 
         # Return just the ID
         return bom_id
 
+    async def _insert_bom(self, product_id: uuid.UUID, bom_name: str, items: list[dict[str, Any]]) -> tuple[uuid.UUID, list[uuid.UUID]]:
+        """
+        Insert header BOM + semua item-nya dalam satu statement (satu round trip):
+        `WITH b AS (INSERT INTO boms ... RETURNING id) INSERT INTO bom_items SELECT ... FROM b, (VALUES ...)`.
+        """
+        bom_id = uuid.uuid4()
+        item_ids = [uuid.uuid4() for _ in items]
+        table = BOMItem.__table__
+        names = ("id", "sequence", "item_type", "product_id", "work_center_id", "quantity", "duration_minutes")
+
+        item_values = values(*(column(name, table.c[name].type) for name in names), name="v").data([(item_id, *(item.get(name) for name in names[1:])) for item_id, item in zip(item_ids, items)])
+        header = insert(BOM).values(id=bom_id, product_id=product_id, bom_name=bom_name, is_active=True).returning(BOM.id).cte("b")
+        # CAST eksplisit: kolom VALUES yang isinya NULL semua akan di-resolve PG sebagai text
+        rows = select(header.c.id, *(cast(item_values.c[name], table.c[name].type) for name in names)).select_from(header.join(item_values, true()))
+
+        await self.db.execute(insert(BOMItem).from_select(["bom_id", *names], rows))
+        return bom_id, item_ids
+
     async def seed_boms(self) -> None:
         """Create Bills of Materials for finished products"""
         # BOM for Industrial Water Pump
         pump_product = await self.find_product_by_sku("PUMP-001")
-        pump_bom = BOM(product_id=pump_product.id, bom_name="Water Pump 10HP Standard BOM", is_active=True)
-        self.db.add(pump_bom)
-        await self.db.flush()  # Flush to get the BOM ID
-
         # BOM items for pump
         pump_items = [
             {
@@ -506,36 +581,28 @@ class SampleDataSeeder:
             {
                 "sequence": 6,
                 "item_type": "operation",
-                "work_center_id": self.data["work_centers"][0].id,
+                "work_center_id": self.data["work_centers"][0],
                 "quantity": 1,
                 "duration_minutes": 30,
             },
             {
                 "sequence": 7,
                 "item_type": "operation",
-                "work_center_id": self.data["work_centers"][1].id,
+                "work_center_id": self.data["work_centers"][1],
                 "quantity": 1,
                 "duration_minutes": 45,
             },
             {
                 "sequence": 8,
                 "item_type": "operation",
-                "work_center_id": self.data["work_centers"][2].id,
+                "work_center_id": self.data["work_centers"][2],
                 "quantity": 1,
                 "duration_minutes": 120,
             },
         ]
 
-        for item_data in pump_items:
-            bom_item = BOMItem(bom_id=pump_bom.id, **item_data)
-            self.db.add(bom_item)
-
         # BOM for Conveyor Belt System
         conv_product = await self.find_product_by_sku("CONV-001")
-        conv_bom = BOM(product_id=conv_product.id, bom_name="Conveyor Belt System BOM", is_active=True)
-        self.db.add(conv_bom)
-        await self.db.flush()  # Flush to get the BOM ID
-
         # BOM items for conveyor
         conv_items = [
             {
@@ -559,149 +626,76 @@ class SampleDataSeeder:
             {
                 "sequence": 4,
                 "item_type": "operation",
-                "work_center_id": self.data["work_centers"][0].id,
+                "work_center_id": self.data["work_centers"][0],
                 "quantity": 1,
                 "duration_minutes": 60,
             },
             {
                 "sequence": 5,
                 "item_type": "operation",
-                "work_center_id": self.data["work_centers"][2].id,
+                "work_center_id": self.data["work_centers"][2],
                 "quantity": 1,
                 "duration_minutes": 180,
             },
             {
                 "sequence": 6,
                 "item_type": "operation",
-                "work_center_id": self.data["work_centers"][4].id,
+                "work_center_id": self.data["work_centers"][4],
                 "quantity": 1,
                 "duration_minutes": 240,
             },
         ]
 
-        for item_data in conv_items:
-            bom_item = BOMItem(bom_id=conv_bom.id, **item_data)
-            self.db.add(bom_item)
+        pump_bom_id, pump_item_ids = await self._insert_bom(pump_product.id, "Water Pump 10HP Standard BOM", pump_items)
+        conv_bom_id, conv_item_ids = await self._insert_bom(conv_product.id, "Conveyor Belt System BOM", conv_items)
+
+        self.data["boms"] = [pump_bom_id, conv_bom_id]
+        self.data["bom_items"] = pump_item_ids + conv_item_ids
+        self._bom_id_by_product_sku.update({"PUMP-001": pump_bom_id, "CONV-001": conv_bom_id})
 
     async def seed_initial_stock(self) -> None:
         """Create initial stock balances and ledger entries"""
-        self.data["stock_balances"] = []
-        self.data["stock_ledgers"] = []
-
         # Get warehouse locations
-        warehouse_bins = [loc for loc in self.data["locations"] if loc.code.startswith("WH001-")]
-
-        # Get raw materials using raw SQL to avoid ORM enum issues
-        import uuid
-
-        from sqlalchemy import text
-
-        raw_materials_result = await self.db.execute(text("SELECT id, sku FROM products WHERE category = 'material'"))
-        raw_materials = raw_materials_result.fetchall()
-
-        for i, product in enumerate(raw_materials):
-            location = warehouse_bins[i % len(warehouse_bins)]
-            quantity = (i + 1) * 100  # 100, 200, 300...
-
-            # Create initial ledger entry - trigger will auto-create stock balance
-            await self.db.execute(
-                text(
-                    """
-                    INSERT INTO stock_ledgers (
-                        id,
-                        product_id,
-                        location_id,
-                        qty,
-                        transaction_type,
-                        ref_type,
-                        ref_id,
-                        created_by
-                    )
-                    VALUES (
-                        :id,
-                        :product_id,
-                        :location_id,
-                        :qty,
-                        :transaction_type,
-                        :ref_type,
-                        :ref_id,
-                        :created_by
-                    )
-                    """
-                ),
-                {
-                    "id": uuid.uuid4(),
-                    "product_id": product[0],
-                    "location_id": location.id,
-                    "qty": quantity,
-                    "transaction_type": "purchase",
-                    "ref_type": "purchase_order_item",
-                    "ref_id": uuid.uuid4(),
-                    "created_by": None,
-                },
-            )
-
-        # Create initial stock for parts
-        parts_result = await self.db.execute(text("SELECT id, sku FROM products WHERE category = 'parts'"))
-        parts = parts_result.fetchall()
-        for i, product in enumerate(parts):
-            location = warehouse_bins[(i + 3) % len(warehouse_bins)]
-            quantity = (i + 1) * 50  # 50, 100...
-
-            # Create initial ledger entry - trigger will auto-create stock balance
-            await self.db.execute(
-                text(
-                    """
-                    INSERT INTO stock_ledgers (
-                        id,
-                        product_id,
-                        location_id,
-                        qty,
-                        transaction_type,
-                        ref_type,
-                        ref_id,
-                        created_by
-                    )
-                    VALUES (
-                        :id,
-                        :product_id,
-                        :location_id,
-                        :qty,
-                        :transaction_type,
-                        :ref_type,
-                        :ref_id,
-                        :created_by
-                    )
-                    """
-                ),
-                {
-                    "id": uuid.uuid4(),
-                    "product_id": product[0],
-                    "location_id": location.id,
-                    "qty": quantity,
-                    "transaction_type": "purchase",
-                    "ref_type": "purchase_order_item",
-                    "ref_id": uuid.uuid4(),
-                    "created_by": None,
-                },
-            )
+        warehouse_bins = [loc_id for code, loc_id in self._location_by_code.items() if code.startswith("WH001-")]
+
+        # Product id material/parts diambil dari hasil seed_products (tanpa SELECT ke products).
+        # Nomor urut per kategori (row_number atas ordinality) menggantikan enumerate(), modulo atas
+        # array bin menggantikan `i % len(bins)`: material mulai dari bin 0 dengan qty kelipatan 100,
+        # parts mulai dari bin 3 dengan qty kelipatan 50. Trigger stock_ledgers tetap membuat stock
+        # balance secara otomatis.
+        product_ids = [self._product_ids_by_category.get(category, []) for category, _, _ in _INITIAL_STOCK_PLAN]
+        params: dict[str, Any] = {
+            "bin_ids": warehouse_bins,
+            "bin_count": len(warehouse_bins),
+            "bin_offsets": [bin_offset for _, bin_offset, _ in _INITIAL_STOCK_PLAN],
+            "qty_steps": [qty_step for _, _, qty_step in _INITIAL_STOCK_PLAN],
+            "product_ids": [product_id for ids in product_ids for product_id in ids],
+            "plans": [plan for plan, ids in enumerate(product_ids, start=1) for _ in ids],
+        }
 
-        await self.db.flush()
+        await self.db.execute(_INSERT_STOCK_LEDGER, params)
 
     async def seed_purchase_orders(self) -> None:
         """Create sample purchase orders"""
-        self.data["purchase_orders"] = []
-
-        # PO for raw materials
-        po1 = PurchaseOrder(
-            po_number="PO-2024-001",
-            supplier_id=self.data["suppliers"][0].id,
-            status="confirmed",
-            notes="Urgent raw materials for production",
+        # PO for raw materials + PO for electronic components
+        self.data["purchase_orders"] = await self._bulk_insert(
+            PurchaseOrder,
+            [
+                {
+                    "po_number": "PO-2024-001",
+                    "supplier_id": self.data["suppliers"][0],
+                    "status": "confirmed",
+                    "notes": "Urgent raw materials for production",
+                },
+                {
+                    "po_number": "PO-2024-002",
+                    "supplier_id": self.data["suppliers"][2],
+                    "status": "confirmed",
+                    "notes": "Electronic components for new product line",
+                },
+            ],
         )
-        self.db.add(po1)
-        self.data["purchase_orders"].append(po1)
-        await self.db.flush()  # Flush to get the PO ID
+        po1_id, po2_id = self.data["purchase_orders"]
 
         # PO items
         po1_items = [
@@ -717,21 +711,6 @@ class SampleDataSeeder:
             },
         ]
 
-        for item_data in po1_items:
-            item = PurchaseOrderItem(po_id=po1.id, **item_data)
-            self.db.add(item)
-
-        # PO for electronic components
-        po2 = PurchaseOrder(
-            po_number="PO-2024-002",
-            supplier_id=self.data["suppliers"][2].id,
-            status="confirmed",
-            notes="Electronic components for new product line",
-        )
-        self.db.add(po2)
-        self.data["purchase_orders"].append(po2)
-        await self.db.flush()  # Flush to get the PO ID
-
         po2_items = [
             {
                 "product_id": (await self.find_product_by_sku("ELEC-001")).id,
@@ -740,58 +719,44 @@ class SampleDataSeeder:
             },
         ]
 
-        for item_data in po2_items:
-            item = PurchaseOrderItem(po_id=po2.id, **item_data)
-            self.db.add(item)
+        await self._bulk_insert(
+            PurchaseOrderItem,
+            [
+                *({"po_id": po1_id, **item_data} for item_data in po1_items),
+                *({"po_id": po2_id, **item_data} for item_data in po2_items),
+            ],
+        )
 
-        await self.db.flush()
+    async def _create_sales_orders(self, *orders: dict[str, Any]) -> list[uuid.UUID]:
+        """Insert header sales order via raw SQL (menghindari masalah model) dalam satu executemany."""
+        rows = [{"id": uuid.uuid4(), "created_by": None, **order} for order in orders]
+        await self.db.execute(_INSERT_SALES_ORDER, rows)
+        return [row["id"] for row in rows]
 
     async def seed_sales_orders(self) -> None:
         """Create sample sales orders"""
-        self.data["sales_orders"] = []
-        self.data["sales_order_items"] = []
-
-        # SO for retail customer - use raw SQL to avoid model issues
-        from sqlalchemy import text
-
-        so1_id = uuid.uuid4()
-        await self.db.execute(
-            text(
-                """
-                INSERT INTO sales_orders (
-                    id,
-                    so_number,
-                    customer_id,
-                    order_date,
-                    delivery_date,
-                    status,
-                    notes,
-                    created_by
-                )
-                VALUES (
-                    :id,
-                    :so_number,
-                    :customer_id,
-                    :order_date,
-                    :delivery_date,
-                    :status,
-                    :notes,
-                    :created_by
-                )
-                """
-            ),
-            {
-                "id": so1_id,
+        now = datetime.now(timezone.utc)
+
+        # SO for retail customer + SO for distributor
+        so1_id, so2_id = await self._create_sales_orders(
+            {
                 "so_number": "SO-2024-001",
-                "customer_id": self.data["customers"][0].id,
-                "order_date": datetime.now(timezone.utc) - timedelta(days=5),
-                "expected_date": datetime.now(timezone.utc) + timedelta(days=10),
+                "customer_id": self.data["customers"][0],
+                "order_date": now - _SO1_ORDER_AGE,
+                "delivery_date": now + _SO1_LEAD_TIME,
                 "status": "confirmed",
                 "notes": "Regular order - priority customer",
-                "created_by": None,
+            },
+            {
+                "so_number": "SO-2024-002",
+                "customer_id": self.data["customers"][1],
+                "order_date": now - _SO2_ORDER_AGE,
+                "delivery_date": now + _SO2_LEAD_TIME,
+                "status": "draft",
+                "notes": "Awaiting confirmation from customer",
             },
         )
-        self.data["sales_orders"].append(so1_id)  # Store the ID
+        self.data["sales_orders"] = [so1_id, so2_id]  # Store the IDs
 
         # SO items
         so1_items = [
@@ -807,51 +772,6 @@ class SampleDataSeeder:
             },
         ]
 
-        for item_data in so1_items:
-            item = SalesOrderItem(so_id=so1_id, **item_data)
-            self.db.add(item)
-            self.data["sales_order_items"].append(item)
-
-        # SO for distributor - use raw SQL to avoid model issues
-        so2_id = uuid.uuid4()
-        await self.db.execute(
-            text(
-                """
-                INSERT INTO sales_orders (
-                    id,
-                    so_number,
-                    customer_id,
-                    order_date,
-                    delivery_date,
-                    status,
-                    notes,
-                    created_by
-                )
-                VALUES (
-                    :id,
-                    :so_number,
-                    :customer_id,
-                    :order_date,
-                    :delivery_date,
-                    :status,
-                    :notes,
-                    :created_by
-                )
-                """
-            ),
-            {
-                "id": so2_id,
-                "so_number": "SO-2024-002",
-                "customer_id": self.data["customers"][1].id,
-                "order_date": datetime.now(timezone.utc) - timedelta(days=2),
-                "delivery_date": datetime.now(timezone.utc) + timedelta(days=30),
-                "status": "draft",
-                "notes": "Awaiting confirmation from customer",
-                "created_by": None,
-            },
-        )
-        self.data["sales_orders"].append(so2_id)  # Store the ID
-
         so2_items = [
             {
                 "product_id": (await self.find_product_by_sku("PUMP-001")).id,
@@ -860,71 +780,57 @@ class SampleDataSeeder:
             },
         ]
 
-        for item_data in so2_items:
-            item = SalesOrderItem(so_id=so2_id, **item_data)
-            self.db.add(item)
-            self.data["sales_order_items"].append(item)
-
-        await self.db.flush()
+        # Item kedua SO dalam satu batch INSERT
+        self.data["sales_order_items"] = await self._bulk_insert(
+            SalesOrderItem,
+            [
+                *({"so_id": so1_id, **item_data} for item_data in so1_items),
+                *({"so_id": so2_id, **item_data} for item_data in so2_items),
+            ],
+        )
 
     async def seed_production_orders(self) -> None:
         """Create sample production orders linked to sales orders"""
-        self.data["production_orders"] = []
-
-        # Get BOM IDs and sales orders
-        pump_bom_id = await self.find_bom_by_product_sku("PUMP-001")
-        conv_bom_id = await self.find_bom_by_product_sku("CONV-001")
-
-        # Get product IDs for the BOMs using raw SQL to avoid enum issues
-        from sqlalchemy import text
-
-        pump_result = await self.db.execute(text("SELECT id FROM products WHERE sku = 'PUMP-001'"))
-        pump_product_id = pump_result.scalar_one()
-        conv_result = await self.db.execute(text("SELECT id FROM products WHERE sku = 'CONV-001'"))
-        conv_product_id = conv_result.scalar_one()
-
-        # Production order for pumps (linked to sales order)
-        po1 = ProductionOrder(
-            order_number="PROD-2024-001",
-            product_id=pump_product_id,
-            bom_id=pump_bom_id,
-            so_item_id=self.data["sales_order_items"][0].id,  # Link to first sales order item
-            qty_planned=5,
-            qty_produced=0,
-            status="draft",
-            created_by=None,  # No user ID available
-        )
-        self.db.add(po1)
-        self.data["production_orders"].append(po1)
-
-        # Production order for conveyors (linked to sales order)
-        po2 = ProductionOrder(
-            order_number="PROD-2024-002",
-            product_id=conv_product_id,
-            bom_id=conv_bom_id,
-            so_item_id=self.data["sales_order_items"][1].id,  # Link to second sales order item
-            qty_planned=2,
-            qty_produced=0,
-            status="draft",
-            created_by=None,
-        )
-        self.db.add(po2)
-        self.data["production_orders"].append(po2)
-
-        # Additional production order for stock replenishment
-        po3 = ProductionOrder(
-            order_number="PROD-2024-003",
-            product_id=pump_product_id,
-            bom_id=pump_bom_id,
-            qty_planned=10,
-            qty_produced=0,
-            status="draft",
-            created_by=None,
-        )
-        self.db.add(po3)
-        self.data["production_orders"].append(po3)
+        # Product id + BOM id per SKU dalam satu lookup ke index in-memory (tanpa query)
+        (pump_product_id, pump_bom_id), (conv_product_id, conv_bom_id) = [(self._product_id_by_sku[sku], await self.find_bom_by_product_sku(sku)) for sku in ("PUMP-001", "CONV-001")]
 
-        await self.db.flush()
+        self.data["production_orders"] = await self._bulk_insert(
+            ProductionOrder,
+            [
+                # Production order for pumps (linked to first sales order item)
+                {
+                    "order_number": "PROD-2024-001",
+                    "product_id": pump_product_id,
+                    "bom_id": pump_bom_id,
+                    "so_item_id": self.data["sales_order_items"][0],
+                    "qty_planned": 5,
+                    "qty_produced": 0,
+                    "status": "draft",
+                    "created_by": None,  # No user ID available
+                },
+                # Production order for conveyors (linked to second sales order item)
+                {
+                    "order_number": "PROD-2024-002",
+                    "product_id": conv_product_id,
+                    "bom_id": conv_bom_id,
+                    "so_item_id": self.data["sales_order_items"][1],
+                    "qty_planned": 2,
+                    "qty_produced": 0,
+                    "status": "draft",
+                    "created_by": None,
+                },
+                # Additional production order for stock replenishment
+                {
+                    "order_number": "PROD-2024-003",
+                    "product_id": pump_product_id,
+                    "bom_id": pump_bom_id,
+                    "qty_planned": 10,
+                    "qty_produced": 0,
+                    "status": "draft",
+                    "created_by": None,
+                },
+            ],
+        )
 
 
 async def seed_sample_data(db: Optional[AsyncSession] = None) -> dict[str, int]:
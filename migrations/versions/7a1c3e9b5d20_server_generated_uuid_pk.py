@@ -0,0 +1,46 @@
+"""server_generated_uuid_pk
+
+Revision ID: 7a1c3e9b5d20
+Revises: 2d64e6f050dc
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "7a1c3e9b5d20"
+down_revision = "2d64e6f050dc"
+branch_labels = None
+depends_on = None
+
+# Semua tabel dengan primary key UUID tunggal. gen_random_uuid() built-in sejak PostgreSQL 13.
+tables_with_uuid_pk = [
+    "permissions",
+    "roles",
+    "users",
+    "suppliers",
+    "customers",
+    "locations",
+    "products",
+    "stock_ledgers",
+    "work_centers",
+    "boms",
+    "bom_items",
+    "production_orders",
+    "purchase_orders",
+    "purchase_order_items",
+    "sales_orders",
+    "sales_order_items",
+]
+
+
+def upgrade() -> None:
+    for table in tables_with_uuid_pk:
+        op.alter_column(table, "id", server_default=sa.text("gen_random_uuid()"))
+
+
+def downgrade() -> None:
+    for table in tables_with_uuid_pk:
+        op.alter_column(table, "id", server_default=None)
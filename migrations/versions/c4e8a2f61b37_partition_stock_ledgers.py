@@ -0,0 +1,157 @@
+"""partition_stock_ledgers
+
+Revision ID: c4e8a2f61b37
+Revises: 7a1c3e9b5d20
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c4e8a2f61b37"
+down_revision = "7a1c3e9b5d20"
+branch_labels = None
+depends_on = None
+
+# Index stock_ledgers dari initial schema, dibuat ulang di tabel baru dengan nama yang sama
+ledger_indexes = {
+    "idx_ledger_product_location": "product_id, location_id",
+    "idx_ledger_product_location_created": "product_id, location_id, created_at",
+    "idx_ledger_ref": "ref_type, ref_id",
+    "ix_stock_ledgers_created_at": "created_at",
+    "ix_stock_ledgers_location_id": "location_id",
+    "ix_stock_ledgers_product_id": "product_id",
+    "ix_stock_ledgers_transaction_type": "transaction_type",
+}
+
+# Partisi bulanan stock_ledgers_pYYYYMM (batas dalam UTC) sampai `months_ahead` bulan ke depan.
+# Dipanggil migration ini dan scripts/prod/cleanup_old_data.py. Bulan yang row-nya sudah
+# terlanjur masuk partisi default dilewati (CREATE ... PARTITION OF akan gagal).
+ensure_partitions_function = """
+    CREATE OR REPLACE FUNCTION ensure_stock_ledger_partitions(
+        months_ahead integer, since timestamptz DEFAULT NULL
+    )
+    RETURNS integer AS $func$
+    DECLARE
+        month_start timestamptz;
+        last_month timestamptz;
+        partition_name text;
+        created integer := 0;
+    BEGIN
+        month_start := date_trunc('month', COALESCE(since, now()) AT TIME ZONE 'UTC')
+            AT TIME ZONE 'UTC';
+        last_month := date_trunc('month', now() AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'
+            + make_interval(months => months_ahead);
+
+        WHILE month_start <= last_month LOOP
+            partition_name := 'stock_ledgers_p'
+                || to_char(month_start AT TIME ZONE 'UTC', 'YYYYMM');
+
+            IF to_regclass(partition_name) IS NULL AND NOT EXISTS (
+                SELECT 1 FROM stock_ledgers_default
+                WHERE created_at >= month_start AND created_at < month_start + interval '1 month'
+            ) THEN
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF stock_ledgers FOR VALUES FROM (%L) TO (%L)',
+                    partition_name, month_start, month_start + interval '1 month'
+                );
+                created := created + 1;
+            END IF;
+
+            month_start := month_start + interval '1 month';
+        END LOOP;
+
+        RETURN created;
+    END;
+    $func$ LANGUAGE plpgsql;
+"""
+
+
+def create_ledger_constraints() -> None:
+    for name, columns in ledger_indexes.items():
+        op.execute(f"CREATE INDEX {name} ON stock_ledgers ({columns})")
+
+    op.execute("""
+        ALTER TABLE stock_ledgers
+            ADD CONSTRAINT stock_ledgers_created_by_fkey
+                FOREIGN KEY (created_by) REFERENCES users (id) ON DELETE SET NULL,
+            ADD CONSTRAINT stock_ledgers_location_id_fkey
+                FOREIGN KEY (location_id) REFERENCES locations (id) ON DELETE RESTRICT,
+            ADD CONSTRAINT stock_ledgers_product_id_fkey
+                FOREIGN KEY (product_id) REFERENCES products (id) ON DELETE RESTRICT
+    """)
+
+    op.execute("""
+        CREATE TRIGGER trg_update_stock_balance
+        AFTER INSERT ON stock_ledgers
+        FOR EACH ROW EXECUTE FUNCTION fn_update_stock_balance();
+    """)
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE stock_ledgers RENAME TO stock_ledgers_unpartitioned")
+
+    # Partitioned table baru; primary key wajib memuat partition key. Partisi default
+    # menampung row di luar range partisi bulanan yang ada.
+    op.execute("""
+        CREATE TABLE stock_ledgers (
+            LIKE stock_ledgers_unpartitioned INCLUDING DEFAULTS,
+            CONSTRAINT stock_ledgers_partitioned_pkey PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+    op.execute("CREATE TABLE stock_ledgers_default PARTITION OF stock_ledgers DEFAULT")
+    op.execute(ensure_partitions_function)
+    op.execute("SELECT ensure_stock_ledger_partitions(12, (SELECT min(created_at) FROM stock_ledgers_unpartitioned))")
+
+    # Data dipindah sebelum trigger dibuat, jadi stock_balances tidak dihitung ulang
+    op.execute("INSERT INTO stock_ledgers SELECT * FROM stock_ledgers_unpartitioned")
+    op.execute("DROP TABLE stock_ledgers_unpartitioned")
+    op.execute("ALTER TABLE stock_ledgers RENAME CONSTRAINT stock_ledgers_partitioned_pkey TO stock_ledgers_pkey")
+    create_ledger_constraints()
+
+    # Archive ikut dipartisi agar partisi lama cukup di-DETACH dari stock_ledgers lalu
+    # di-ATTACH ke sini. Archive lama (tabel biasa) dibiarkan; cleanup script fallback ke
+    # INSERT/DELETE untuk tabel seperti itu.
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS stock_ledgers_archive (
+            LIKE stock_ledgers INCLUDING DEFAULTS
+        ) PARTITION BY RANGE (created_at)
+    """)
+    # Partisi default archive menampung row lama yang dipindah dari stock_ledgers_default
+    op.execute("""
+        DO $$
+        BEGIN
+            IF (SELECT relkind FROM pg_class WHERE oid = to_regclass('stock_ledgers_archive')) = 'p' THEN
+                CREATE TABLE IF NOT EXISTS stock_ledgers_archive_default PARTITION OF stock_ledgers_archive DEFAULT;
+            END IF;
+        END $$
+    """)
+
+
+def downgrade() -> None:
+    # Archive yang dipartisi (beserta partisi yang di-ATTACH ke sana) dikembalikan jadi tabel biasa
+    op.execute("""
+        DO $$
+        BEGIN
+            IF (SELECT relkind FROM pg_class WHERE oid = to_regclass('stock_ledgers_archive')) = 'p' THEN
+                ALTER TABLE stock_ledgers_archive RENAME TO stock_ledgers_archive_partitioned;
+                CREATE TABLE stock_ledgers_archive (LIKE stock_ledgers_archive_partitioned INCLUDING DEFAULTS);
+                INSERT INTO stock_ledgers_archive SELECT * FROM stock_ledgers_archive_partitioned;
+                DROP TABLE stock_ledgers_archive_partitioned;
+            END IF;
+        END $$
+    """)
+
+    op.execute("ALTER TABLE stock_ledgers RENAME TO stock_ledgers_partitioned")
+    op.execute("""
+        CREATE TABLE stock_ledgers (
+            LIKE stock_ledgers_partitioned INCLUDING DEFAULTS,
+            CONSTRAINT stock_ledgers_plain_pkey PRIMARY KEY (id)
+        )
+    """)
+    op.execute("INSERT INTO stock_ledgers SELECT * FROM stock_ledgers_partitioned")
+    op.execute("DROP TABLE stock_ledgers_partitioned")
+    op.execute("DROP FUNCTION IF EXISTS ensure_stock_ledger_partitions(integer, timestamptz)")
+    op.execute("ALTER TABLE stock_ledgers RENAME CONSTRAINT stock_ledgers_plain_pkey TO stock_ledgers_pkey")
+    create_ledger_constraints()
@@ -1,34 +1,61 @@
 import asyncio
+import subprocess  # nosec B404 - subprocess needed for alembic migration
+import sys
 
 from sqlalchemy import text
 
-from app.database import SessionLocal
+from app.core.cache import close_cache, invalidate
+from app.core.config import settings
+from app.database import SessionLocal, engine
+from app.services import seed_rbac
+
+# Satu DROP SCHEMA menggantikan TRUNCATE per tabel; skema dibuat ulang via alembic
+RESET_SCHEMA_STATEMENTS = (
+    "DROP SCHEMA public CASCADE",
+    "CREATE SCHEMA public",
+    "GRANT ALL ON SCHEMA public TO PUBLIC",
+)
 
 
 async def clean_database() -> None:
     async with SessionLocal() as db:
-        await db.execute(
-            text("""
-            TRUNCATE TABLE
-                production_orders,
-                sales_order_items,
-                sales_orders,
-                purchase_order_items,
-                purchase_orders,
-                stock_ledgers,
-                stock_balances,
-                bom_items,
-                boms,
-                products,
-                locations,
-                customers,
-                suppliers
-            CASCADE
-        """)
-        )
+        # asyncpg tidak menerima beberapa statement dalam satu execute
+        for statement in RESET_SCHEMA_STATEMENTS:
+            await db.execute(text(statement))
         await db.commit()
-        print("Database cleaned successfully!")
+    await engine.dispose()
+    # Semua data yang di-cache ikut terhapus
+    await invalidate("permissions", "roles", "sales:customers", "sales:products")
+    await close_cache()
 
 
-if __name__ == "__main__":
+async def reseed_rbac() -> None:
+    # DROP SCHEMA ikut menghapus users/roles/permissions; RBAC di-seed ulang, admin dibuat manual
+    async with SessionLocal() as db:
+        await seed_rbac(db)
+    await engine.dispose()
+    await close_cache()
+
+
+def main() -> int:
+    if not settings.is_development:
+        print(f"❌ Refusing to drop the database schema when APP_ENV={settings.app_env} (development only)")
+        return 1
+
     asyncio.run(clean_database())
+    print("Schema dropped, re-applying migrations...")
+
+    # Di luar event loop: env.py alembic menjalankan asyncio.run sendiri
+    result = subprocess.run(["alembic", "upgrade", "head"], capture_output=True, text=True)  # nosec
+    if result.returncode != 0:
+        print(f"❌ Migration failed: {result.stderr.strip()}")
+        return 1
+
+    asyncio.run(reseed_rbac())
+    print("Database cleaned successfully! RBAC roles and permissions were re-seeded.")
+    print("All users were removed; create an admin with: uv run erp-bootstrap --bootstrap-admin --username ... --email ... --password ...")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,12 +7,16 @@ Archives or removes old data to maintain system performance
 import argparse
 import asyncio
 import sys
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import SessionLocal
 
+# Di bawah jumlah row ini get_storage_savings menghitung penuh, bukan dari sampel
+SAMPLE_MIN_ROWS = 100_000
+
 
 class DataCleaner:
     def __init__(self, dry_run: bool = True) -> None:
@@ -20,10 +24,13 @@ class DataCleaner:
         self.actions: list[str] = []
         self.warnings: list[str] = []
         self.info: list[str] = []
+        # Tabel yang row-nya dihapus/dipindah, untuk VACUUM dan REINDEX di optimize_database
+        self.touched_tables: set[str] = set()
 
-    def add_action(self, message: str, count: int = 0) -> None:
+    def add_action(self, message: str, count: int = 0, approximate: bool = False) -> None:
         prefix = "Would" if self.dry_run else "Will"
-        self.actions.append(f"🔧 {prefix} {message} ({count} records)" if count else f"🔧 {prefix} {message}")
+        records = f"{'~' if approximate else ''}{count} records"
+        self.actions.append(f"🔧 {prefix} {message} ({records})" if count else f"🔧 {prefix} {message}")
 
     def add_warning(self, message: str) -> None:
         self.warnings.append(f"⚠️  {message}")
@@ -31,59 +38,161 @@ class DataCleaner:
     def add_info(self, message: str) -> None:
         self.info.append(f"ℹ️  {message}")
 
+    @staticmethod
+    async def ensure_archive_tables(db: AsyncSession) -> None:
+        """
+        Buat tabel `<table>_archive` yang belum ada, sekali di awal run.
+
+        Cek to_regclass dulu: `CREATE TABLE IF NOT EXISTS ... (LIKE ... INCLUDING ALL)` tetap
+        membaca katalog tabel sumber walau archive-nya sudah ada, dan gagal jika sumbernya
+        (mis. audit_logs) tidak ada.
+        """
+        result = await db.execute(
+            text("""
+            SELECT source FROM unnest(ARRAY['stock_ledgers', 'audit_logs']) AS source
+            WHERE to_regclass(source) IS NOT NULL
+              AND to_regclass(source || '_archive') IS NULL
+        """)
+        )
+        for table in result.scalars().all():
+            await db.execute(text(f"CREATE TABLE IF NOT EXISTS {table}_archive (LIKE {table} INCLUDING ALL)"))
+        await db.commit()
+
+    @staticmethod
+    async def _count_older_than(db: AsyncSession, table: str, cutoff_date: datetime) -> int:
+        """Jumlah row `table` dengan created_at < cutoff (untuk dry run)."""
+        result = await db.execute(
+            text(f"SELECT COUNT(*) FROM {table} WHERE created_at < :cutoff_date"),
+            {"cutoff_date": cutoff_date},
+        )
+        return result.scalar() or 0
+
+    @staticmethod
+    async def _move_to_archive(db: AsyncSession, table: str, cutoff_date: datetime, archive: str | None = None) -> int:
+        """
+        Pindahkan row lama ke `archive` (default `<table>_archive`) dalam satu statement.
+
+        DELETE ... RETURNING di-CTE lalu langsung di-INSERT ke archive: satu scan atas range
+        cutoff (bukan COUNT + INSERT SELECT + DELETE), jumlahnya dari rowcount.
+        """
+        result = await db.execute(
+            text(f"""
+            WITH moved AS (
+                DELETE FROM {table}
+                WHERE created_at < :cutoff_date
+                RETURNING *
+            )
+            INSERT INTO {archive or f"{table}_archive"}
+            SELECT * FROM moved
+        """),
+            {"cutoff_date": cutoff_date},
+        )
+        return result.rowcount
+
+    @staticmethod
+    async def _archivable_ledger_partitions(db: AsyncSession, cutoff_date: datetime) -> list[tuple[str, datetime, datetime, int]] | None:
+        """
+        Partisi bulanan stock_ledgers yang seluruh range-nya lebih tua dari cutoff.
+
+        Return (nama, batas bawah, batas atas, estimasi row) per partisi, atau None jika
+        stock_ledgers / stock_ledgers_archive bukan partitioned table (fallback INSERT/DELETE).
+        """
+        result = await db.execute(
+            text("""
+            SELECT relname, relkind FROM pg_class
+            WHERE relname IN ('stock_ledgers', 'stock_ledgers_archive')
+              AND relnamespace = 'public'::regnamespace
+        """)
+        )
+        kinds = dict(result.all())
+        if kinds.get("stock_ledgers") != "p" or kinds.get("stock_ledgers_archive") != "p":
+            return None
+
+        result = await db.execute(
+            text("""
+            SELECT c.relname, c.reltuples::bigint
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = 'stock_ledgers'::regclass
+              AND c.relname ~ '^stock_ledgers_p[0-9]{6}$'
+            ORDER BY c.relname
+        """)
+        )
+        cutoff = cutoff_date.astimezone(timezone.utc)
+        partitions = []
+        for name, estimate in result.all():
+            lower = datetime.strptime(name[-6:], "%Y%m").replace(tzinfo=timezone.utc)
+            upper = lower.replace(year=lower.year + lower.month // 12, month=lower.month % 12 + 1)
+            if upper <= cutoff:
+                partitions.append((name, lower, upper, max(estimate, 0)))
+        return partitions
+
+    @staticmethod
+    async def _archive_ledger_partitions(db: AsyncSession, partitions: list[tuple[str, datetime, datetime, int]]) -> int:
+        """DETACH partisi lama dari stock_ledgers lalu ATTACH ke archive (metadata saja)."""
+        for name, lower, upper, _ in partitions:
+            await db.execute(text(f'ALTER TABLE stock_ledgers DETACH PARTITION "{name}"'))
+            await db.execute(text(f"ALTER TABLE stock_ledgers_archive ATTACH PARTITION \"{name}\" FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"))
+        # Siapkan partisi bulan-bulan ke depan selagi di sini
+        await db.execute(text("SELECT ensure_stock_ledger_partitions(3)"))
+        return sum(estimate for *_, estimate in partitions)
+
     async def archive_old_stock_ledgers(self, days_to_keep: int = 365) -> int:
-        """Archive old stock ledger entries."""
+        """
+        Archive old stock ledger entries.
+
+        Jika stock_ledgers dipartisi (migration c4e8a2f61b37), partisi bulanan yang sudah
+        lewat cutoff dipindah utuh ke archive (DETACH + ATTACH, tanpa memindah row); retensi
+        jadi per bulan penuh dan jumlah row adalah estimasi planner. Row lama di partisi
+        default (bulan tanpa partisi sendiri) dipindah per row. Tanpa partisi, row dipindah
+        dengan DELETE ... RETURNING + INSERT.
+        """
         try:
             cutoff_date = datetime.now() - timedelta(days=days_to_keep)
 
             async with SessionLocal() as db:
-                # Count old entries
-                result = await db.execute(
-                    text("""
-                    SELECT COUNT(*) FROM stock_ledgers
-                    WHERE created_at < :cutoff_date
-                """),
-                    {"cutoff_date": cutoff_date},
-                )
-                old_count = result.scalar() or 0
+                partitions = await self._archivable_ledger_partitions(db, cutoff_date)
+                if partitions is not None:
+                    if self.dry_run:
+                        old_count = sum(estimate for *_, estimate in partitions)
+                        default_count = await self._count_older_than(db, "stock_ledgers_default", cutoff_date)
+                    else:
+                        old_count = await self._archive_ledger_partitions(db, partitions)
+                        default_count = await self._move_to_archive(db, "stock_ledgers_default", cutoff_date, archive="stock_ledgers_archive")
+                        await db.commit()
+
+                    # Bulan yang row-nya sudah masuk partisi default tidak akan dapat partisi sendiri
+                    result = await db.execute(text("SELECT EXISTS (SELECT 1 FROM stock_ledgers_default)"))
+                    if result.scalar():
+                        self.add_warning("stock_ledgers_default is not empty: some months have no partition of their own (run cleanup at least monthly so ensure_stock_ledger_partitions stays ahead)")
+
+                    if not partitions and not default_count:
+                        self.add_info("No stock ledger partitions old enough to archive")
+                        return 0
+
+                    if partitions:
+                        self.add_action(
+                            f"archive {len(partitions)} stock ledger partition(s) older than {days_to_keep} days",
+                            old_count,
+                            approximate=True,
+                        )
+                    if default_count:
+                        self.add_action(f"archive default-partition stock ledger entries older than {days_to_keep} days", default_count)
+                        self.touched_tables.add("stock_ledgers_default")
+                    return old_count + default_count
+
+                if self.dry_run:
+                    old_count = await self._count_older_than(db, "stock_ledgers", cutoff_date)
+                else:
+                    old_count = await self._move_to_archive(db, "stock_ledgers", cutoff_date)
+                    await db.commit()
 
                 if old_count == 0:
                     self.add_info("No old stock ledger entries to archive")
                     return 0
 
                 self.add_action(f"archive stock ledger entries older than {days_to_keep} days", old_count)
-
-                if not self.dry_run:
-                    # Create archive table if it doesn't exist
-                    await db.execute(
-                        text("""
-                        CREATE TABLE IF NOT EXISTS stock_ledgers_archive (
-                            LIKE stock_ledgers INCLUDING ALL
-                        )
-                    """)
-                    )
-
-                    # Move old entries to archive
-                    await db.execute(
-                        text("""
-                        INSERT INTO stock_ledgers_archive
-                        SELECT * FROM stock_ledgers
-                        WHERE created_at < :cutoff_date
-                    """),
-                        {"cutoff_date": cutoff_date},
-                    )
-
-                    # Delete old entries
-                    await db.execute(
-                        text("""
-                        DELETE FROM stock_ledgers
-                        WHERE created_at < :cutoff_date
-                    """),
-                        {"cutoff_date": cutoff_date},
-                    )
-
-                    await db.commit()
-
+                self.touched_tables.update(("stock_ledgers", "stock_ledgers_archive"))
                 return old_count
 
         except Exception as e:
@@ -111,33 +220,61 @@ class DataCleaner:
                     self.add_info("No sessions table found")
                     return 0
 
-                # Count old sessions
-                result = await db.execute(
-                    text("""
-                    SELECT COUNT(*) FROM sessions
-                    WHERE created_at < :cutoff_date OR expires_at < NOW()
-                """),
-                    {"cutoff_date": cutoff_date},
-                )
-                old_count = result.scalar() or 0
-
-                if old_count == 0:
-                    self.add_info("No old sessions to clean up")
-                    return 0
-
-                self.add_action(f"delete sessions older than {days_to_keep} days or expired", old_count)
-
-                if not self.dry_run:
-                    await db.execute(
+                approximate = False
+                if self.dry_run:
+                    result = await db.execute(
                         text("""
-                        DELETE FROM sessions
+                        SELECT COUNT(*) FROM sessions
                         WHERE created_at < :cutoff_date OR expires_at < NOW()
                     """),
                         {"cutoff_date": cutoff_date},
                     )
+                    old_count = result.scalar() or 0
+                else:
+                    # Kalau tidak ada session yang tersisa, TRUNCATE jauh lebih murah dari DELETE
+                    # (tanpa dead tuple). Cek dulu tanpa lock; ACCESS EXCLUSIVE hanya diambil
+                    # untuk jalur TRUNCATE, lalu dicek ulang agar tidak ada session baru di sela.
+                    all_expired = text("""
+                        SELECT NOT EXISTS (
+                            SELECT 1 FROM sessions
+                            WHERE (created_at < :cutoff_date OR expires_at < NOW()) IS NOT TRUE
+                        )
+                    """)
+                    result = await db.execute(all_expired, {"cutoff_date": cutoff_date})
+                    truncate = result.scalar()
+                    if truncate:
+                        await db.execute(text("LOCK TABLE sessions IN ACCESS EXCLUSIVE MODE"))
+                        result = await db.execute(all_expired, {"cutoff_date": cutoff_date})
+                        truncate = result.scalar()
+
+                    if truncate:
+                        # TRUNCATE tidak punya rowcount; pakai estimasi planner
+                        result = await db.execute(text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'sessions'::regclass"))
+                        old_count = max(result.scalar() or 0, 0)
+                        approximate = True
+                        await db.execute(text("TRUNCATE sessions"))
+                    else:
+                        result = await db.execute(
+                            text("""
+                            DELETE FROM sessions
+                            WHERE created_at < :cutoff_date OR expires_at < NOW()
+                        """),
+                            {"cutoff_date": cutoff_date},
+                        )
+                        old_count = result.rowcount
 
                     await db.commit()
 
+                if old_count == 0:
+                    self.add_info("No old sessions to clean up")
+                    return 0
+
+                self.add_action(
+                    f"delete sessions older than {days_to_keep} days or expired",
+                    old_count,
+                    approximate=approximate,
+                )
+                self.touched_tables.add("sessions")
                 return old_count
 
         except Exception as e:
@@ -178,53 +315,18 @@ class DataCleaner:
                     self.add_info("No audit_logs table found")
                     return 0
 
-                # Count old audit entries
-                result = await db.execute(
-                    text("""
-                    SELECT COUNT(*) FROM audit_logs
-                    WHERE created_at < :cutoff_date
-                """),
-                    {"cutoff_date": cutoff_date},
-                )
-                old_count = result.scalar() or 0
+                if self.dry_run:
+                    old_count = await self._count_older_than(db, "audit_logs", cutoff_date)
+                else:
+                    old_count = await self._move_to_archive(db, "audit_logs", cutoff_date)
+                    await db.commit()
 
                 if old_count == 0:
                     self.add_info("No old audit logs to clean up")
                     return 0
 
                 self.add_action(f"archive audit logs older than {days_to_keep} days", old_count)
-
-                if not self.dry_run:
-                    # Create archive table
-                    await db.execute(
-                        text("""
-                        CREATE TABLE IF NOT EXISTS audit_logs_archive (
-                            LIKE audit_logs INCLUDING ALL
-                        )
-                    """)
-                    )
-
-                    # Archive old entries
-                    await db.execute(
-                        text("""
-                        INSERT INTO audit_logs_archive
-                        SELECT * FROM audit_logs
-                        WHERE created_at < :cutoff_date
-                    """),
-                        {"cutoff_date": cutoff_date},
-                    )
-
-                    # Delete old entries
-                    await db.execute(
-                        text("""
-                        DELETE FROM audit_logs
-                        WHERE created_at < :cutoff_date
-                    """),
-                        {"cutoff_date": cutoff_date},
-                    )
-
-                    await db.commit()
-
+                self.touched_tables.update(("audit_logs", "audit_logs_archive"))
                 return old_count
 
         except Exception as e:
@@ -232,42 +334,60 @@ class DataCleaner:
             return 0
 
     async def optimize_database(self) -> None:
-        """Run database optimization commands."""
+        """VACUUM (ANALYZE) dan REINDEX CONCURRENTLY hanya untuk tabel yang disentuh cleanup."""
         try:
-            self.add_action("update database statistics")
-            self.add_action("rebuild indexes (if needed)")
+            if not self.touched_tables:
+                self.add_info("No tables modified, skipping database optimization")
+                return
+
+            tables = sorted(self.touched_tables)
+            self.add_action(f"vacuum and analyze {', '.join(tables)}")
+            self.add_action(f"rebuild indexes concurrently on {', '.join(tables)}")
 
             if not self.dry_run:
                 async with SessionLocal() as db:
-                    # Update statistics
-                    await db.execute(text("ANALYZE"))
-
-                    # This would typically include VACUUM operations
-                    # but those might require superuser privileges
-                    await db.commit()
+                    # VACUUM dan REINDEX CONCURRENTLY tidak boleh di dalam transaction block
+                    conn = await db.connection(execution_options={"isolation_level": "AUTOCOMMIT"})
+                    for table in tables:
+                        await conn.execute(text(f"VACUUM (ANALYZE) {table}"))
+                        await conn.execute(text(f"REINDEX TABLE CONCURRENTLY {table}"))
 
         except Exception as e:
             self.add_warning(f"Failed to optimize database: {e}")
 
     async def get_storage_savings(self) -> dict[str, int]:
-        """Estimate storage savings from cleanup."""
+        """
+        Estimate storage savings from cleanup.
+
+        Angkanya perkiraan: jumlah row dari statistik planner (pg_class.reltuples) dan rasio
+        row lama dari sampel TABLESAMPLE SYSTEM (1%), bukan COUNT(*) atas seluruh tabel.
+        Tabel kecil (< SAMPLE_MIN_ROWS) tetap dihitung penuh karena sampelnya bisa kosong.
+        """
         try:
             async with SessionLocal() as db:
                 savings = {}
 
+                # reltuples per partisi leaf (tabel biasa = leaf-nya sendiri); -1 = belum di-ANALYZE
+                result = await db.execute(
+                    text("""
+                    SELECT COALESCE(sum(c.reltuples) FILTER (WHERE c.reltuples > 0), 0)::bigint
+                    FROM pg_partition_tree('stock_ledgers') t
+                    JOIN pg_class c ON c.oid = t.relid
+                    WHERE t.isleaf
+                """)
+                )
+                sample = "TABLESAMPLE SYSTEM (1)" if result.scalar() >= SAMPLE_MIN_ROWS else ""
+
                 # Estimate stock ledger savings
                 result = await db.execute(
-                    text(
-                        """
-                        SELECT
-                            COUNT(*) as total_entries,
-                            COUNT(*) FILTER (
-                                WHERE created_at < NOW() - INTERVAL '365 days'
-                            ) as old_entries,
-                            pg_size_pretty(pg_total_relation_size('stock_ledgers')) as total_size
-                        FROM stock_ledgers
-                        """
-                    )
+                    text(f"""
+                    SELECT
+                        COUNT(*) as total_entries,
+                        COUNT(*) FILTER (
+                            WHERE created_at < NOW() - INTERVAL '365 days'
+                        ) as old_entries
+                    FROM stock_ledgers {sample}
+                """)
                 )
                 ledger_stats = result.fetchone()
 
@@ -290,28 +410,34 @@ class DataCleaner:
         print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print()
 
-        total_cleaned = 0
-
-        # Run cleanup tasks
-        if options.get("stock_ledgers", 0) > 0:
-            print("Cleaning old stock ledgers...")
-            total_cleaned += await self.archive_old_stock_ledgers(options["stock_ledgers"])
-            print()
-
-        if options.get("sessions", 0) > 0:
-            print("Cleaning old sessions...")
-            total_cleaned += await self.cleanup_old_sessions(options["sessions"])
-            print()
-
-        if options.get("audit_logs", 0) > 0:
-            print("Cleaning old audit logs...")
-            total_cleaned += await self.cleanup_audit_logs(options["audit_logs"])
-            print()
+        if not self.dry_run:
+            try:
+                async with SessionLocal() as db:
+                    await self.ensure_archive_tables(db)
+            except Exception as e:
+                self.add_warning(f"Could not create archive tables: {e}")
+
+        # Run cleanup tasks - tabel berbeda dan session sendiri-sendiri, jadi dijalankan paralel
+        tasks = {
+            "stock_ledgers": ("Cleaning old stock ledgers...", self.archive_old_stock_ledgers),
+            "sessions": ("Cleaning old sessions...", self.cleanup_old_sessions),
+            "audit_logs": ("Cleaning old audit logs...", self.cleanup_audit_logs),
+            "temp_files": ("Cleaning temporary files...", self.cleanup_temp_files),
+        }
+        pending = []
+        for key, (label, task) in tasks.items():
+            if options.get(key, 0) > 0:
+                print(label)
+                pending.append(task(options[key]))
+        print()
 
-        if options.get("temp_files", 0) > 0:
-            print("Cleaning temporary files...")
-            total_cleaned += await self.cleanup_temp_files(options["temp_files"])
-            print()
+        results = await asyncio.gather(*pending, return_exceptions=True)
+        total_cleaned = 0
+        for result in results:
+            if isinstance(result, BaseException):
+                self.add_warning(f"Cleanup task failed: {result}")
+            else:
+                total_cleaned += result
 
         # Always optimize
         print("Optimizing database...")
@@ -4,17 +4,113 @@ Production Health Check Script
 Monitors system health and reports issues
 """
 
+import argparse
 import asyncio
+import contextlib
 import sys
+import time
 from datetime import datetime
+from functools import cache
+from typing import Any
 
+try:
+    import psutil
+except ImportError:  # pragma: no cover - psutil opsional untuk health check
+    psutil = None
 
-import psutil
-from sqlalchemy import text
+from asyncpg.exceptions import QueryCanceledError
+from sqlalchemy import TextClause, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.database import SessionLocal, engine
 
+# Batas waktu per query (SET LOCAL, berlaku sampai akhir transaksi check) dan per check
+# (termasuk checkout koneksi), agar DB yang degraded tidak membuat health check ikut hang
+STATEMENT_TIMEOUT = text("SET LOCAL statement_timeout = '3000ms'")
+
+# SQL check dibuat sekali di level modul. Teks SQL yang sama di tiap run (parameter lewat
+# :bind) dipakai ulang oleh statement cache asyncpg sebagai prepared statement, terutama
+# di mode --serve.
+ESSENTIAL_TABLES = (
+    "users",
+    "roles",
+    "permissions",
+    "products",
+    "suppliers",
+    "customers",
+    "sales_orders",
+)
+PING_SQL = text("SELECT 1")
+TABLES_EXIST_SQL = text("""
+    SELECT table_name FROM information_schema.tables
+    WHERE table_schema = 'public' AND table_name = ANY(:names)
+""")
+DB_SIZE_SQL = text("""
+    SELECT size_bytes, pg_size_pretty(size_bytes) AS size
+    FROM pg_database_size(current_database()) AS size_bytes
+""")
+# Jumlah aktivitas 24 jam dibatasi RECENT_ACTIVITY_CAP row: scan berhenti setelah cap tercapai
+# (atau di row pertama untuk sekadar "ada aktivitas"), bukan agregasi seluruh window. Catatan:
+# users/sales_orders belum punya index di created_at; tambahkan jika tabelnya besar.
+RECENT_ACTIVITY_CAP = 1000
+RECENT_ACTIVITY_SQL = text("""
+    SELECT
+        (SELECT COUNT(*) FROM (
+            SELECT 1 FROM users WHERE created_at > NOW() - INTERVAL '24 hours' LIMIT :cap
+        ) u) AS recent_users,
+        (SELECT COUNT(*) FROM (
+            SELECT 1 FROM sales_orders WHERE created_at > NOW() - INTERVAL '24 hours' LIMIT :cap
+        ) o) AS recent_orders
+""")
+
+
+@cache
+def tables_have_rows_sql(tables: tuple[str, ...]) -> TextClause:
+    """
+    Satu query EXISTS per tabel (berhenti di row pertama, tanpa full scan seperti COUNT(*)).
+
+    Nama tabel hanya dari ESSENTIAL_TABLES (konstanta), di-cache per kombinasi tabel.
+    """
+    return text(" UNION ALL ".join(f"SELECT '{t}', EXISTS (SELECT 1 FROM {t})" for t in tables))
+
+
+CHECK_TIMEOUT_SECONDS = 10
+# Idle timeout koneksi keep-alive di mode --serve
+SERVE_KEEPALIVE_SECONDS = 60
+# Hasil check di mode --serve dipakai ulang selama TTL ini (probe orchestrator tiap 1-5 detik)
+REPORT_CACHE_TTL_SECONDS = 10.0
+_report_cache: tuple[float, tuple[bool, str]] | None = None
+_report_lock = asyncio.Lock()
+
+# Snapshot virtual_memory() dipakai ulang selama 1 detik (health loop di proses yang sama)
+MEMORY_SNAPSHOT_TTL_SECONDS = 1.0
+_memory_snapshot: tuple[float, Any] | None = None
+
+
+def memory_snapshot() -> Any:
+    """`psutil.virtual_memory()` yang di-cache selama MEMORY_SNAPSHOT_TTL_SECONDS."""
+    global _memory_snapshot
+    now = time.monotonic()
+    if _memory_snapshot is None or now - _memory_snapshot[0] >= MEMORY_SNAPSHOT_TTL_SECONDS:
+        _memory_snapshot = (now, psutil.virtual_memory())
+    return _memory_snapshot[1]
+
+
+def is_timeout(error: BaseException) -> bool:
+    """
+    True hanya untuk timeout: TimeoutError, atau query yang dibatalkan statement_timeout.
+
+    asyncpg QueryCanceledError dibungkus DBAPIError; error asli ada di `.orig` (atau
+    `__cause__`-nya). Connection refused, auth gagal, dsb. bukan timeout.
+    """
+    if isinstance(error, TimeoutError):
+        return True
+    if isinstance(error, DBAPIError):
+        return any(isinstance(e, QueryCanceledError) for e in (error.orig, error.orig.__cause__))
+    return False
+
 
 class HealthChecker:
     def __init__(self) -> None:
@@ -22,100 +118,92 @@ class HealthChecker:
         self.warnings: list[str] = []
         self.info: list[str] = []
 
+    # Prefix dibuat sekali; ditulis sebagai escape agar tidak rusak oleh editor/encoding
+    _ISSUE = "\u274c "  # ❌
+    _WARN = "\u26a0\ufe0f  "  # ⚠️
+    _INFO = "\u2139\ufe0f  "  # ℹ️
+
     def add_issue(self, message: str) -> None:
-        self.issues.append(f"❌ {message}")
+        self.issues.append(self._ISSUE + message)
 
     def add_warning(self, message: str) -> None:
-        self.warnings.append(f"⚠️  {message}")
+        self.warnings.append(self._WARN + message)
 
     def add_info(self, message: str) -> None:
-        self.info.append(f"ℹ️  {message}")
+        self.info.append(self._INFO + message)
 
     async def check_database_connection(self) -> bool:
-        """Check database connectivity."""
+        """
+        Check database connectivity.
+
+        Koneksi baru (pool kosong) sudah terbukti hidup lewat handshake, dan koneksi dari pool
+        sudah di-ping jika pool_pre_ping aktif; SELECT 1 hanya untuk koneksi pool tanpa ping.
+        """
         try:
-            async with engine.begin() as conn:
-                result = await conn.execute(text("SELECT 1"))
-                if result.scalar() == 1:
-                    self.add_info("Database connection: OK")
-                    return True
+            reused = engine.pool.checkedin() > 0
+            async with engine.connect() as conn:
+                if reused and not settings.db_pool_pre_ping:
+                    result = await conn.execute(PING_SQL)
+                    if result.scalar() != 1:
+                        self.add_issue("Database connection failed: unexpected SELECT 1 result")
+                        return False
+                self.add_info("Database connection: OK")
+                return True
         except Exception as e:
+            if is_timeout(e):
+                self.add_warning(f"Database connection check timed out or was cancelled: {e}")
+                return False
             self.add_issue(f"Database connection failed: {e}")
             return False
-        return False
 
-    async def check_database_tables(self) -> bool:
+    async def check_database_tables(self, db: AsyncSession) -> bool:
         """Check if essential tables exist and have data."""
         try:
-            async with SessionLocal() as db:
-                # Check essential tables
-                essential_tables = [
-                    "users",
-                    "roles",
-                    "permissions",
-                    "products",
-                    "suppliers",
-                    "customers",
-                    "sales_orders",
-                ]
-
-                missing_tables = []
-                empty_tables = []
-
-                for table in essential_tables:
-                    result = await db.execute(text(f"SELECT EXISTS (SELECT FROM information_schema.tables WHERE table_name = '{table}')"))
-                    exists = result.scalar()
-
-                    if not exists:
-                        missing_tables.append(table)
-                    else:
-                        # Check if table has data (except users which might be empty initially)
-                        if table != "users":
-                            count_result = await db.execute(text(f"SELECT COUNT(*) FROM {table}"))
-                            count = count_result.scalar()
-                            if count == 0:
-                                empty_tables.append(table)
-
-                if missing_tables:
-                    self.add_issue(f"Missing tables: {', '.join(missing_tables)}")
-                    return False
-
-                if empty_tables:
-                    self.add_warning(f"Empty tables: {', '.join(empty_tables)}")
-
-                self.add_info("Database tables: OK")
-                return True
+            await db.execute(STATEMENT_TIMEOUT)
+            # Satu query untuk keberadaan semua tabel, bukan satu lookup per tabel
+            result = await db.execute(TABLES_EXIST_SQL, {"names": list(ESSENTIAL_TABLES)})
+            present = set(result.scalars().all())
+            missing_tables = [table for table in ESSENTIAL_TABLES if table not in present]
+
+            # Check if table has data (except users which might be empty initially)
+            probed = tuple(t for t in ESSENTIAL_TABLES if t in present and t != "users")
+            empty_tables = []
+            if probed:
+                result = await db.execute(tables_have_rows_sql(probed))
+                empty_tables = [table for table, has_rows in result.all() if not has_rows]
+
+            if missing_tables:
+                self.add_issue(f"Missing tables: {', '.join(missing_tables)}")
+                return False
+
+            if empty_tables:
+                self.add_warning(f"Empty tables: {', '.join(empty_tables)}")
+
+            self.add_info("Database tables: OK")
+            return True
 
         except Exception as e:
+            if is_timeout(e):
+                self.add_warning(f"Database table check timed out or was cancelled: {e}")
+                return False
             self.add_issue(f"Database table check failed: {e}")
             return False
 
-    async def check_database_size(self) -> bool:
+    async def check_database_size(self, db: AsyncSession) -> bool:
         """Check database size and warn if too large."""
         try:
-            async with SessionLocal() as db:
-                result = await db.execute(
-                    text("""
-                    SELECT pg_size_pretty(pg_database_size(current_database()))
-                """)
-                )
-                size = result.scalar()
-
-                # Get size in bytes for comparison
-                size_bytes_result = await db.execute(
-                    text("""
-                    SELECT pg_database_size(current_database())
-                """)
-                )
-                size_bytes = size_bytes_result.scalar()
-                size_gb = (size_bytes or 0) / (1024**3)
-
-                self.add_info(f"Database size: {size}")
-
-                if size_gb is not None and size_gb > 10:  # Warn if > 10GB
-                    self.add_warning(f"Database size is large: {size_gb:.2f} GB")
+            await db.execute(STATEMENT_TIMEOUT)
+            # Ukuran dalam bytes (untuk perbandingan) dan versi pretty dalam satu round trip
+            result = await db.execute(DB_SIZE_SQL)
+            size_bytes, size = result.one()
+            size_gb = (size_bytes or 0) / (1024**3)
 
-                return True
+            self.add_info(f"Database size: {size}")
+
+            if size_gb is not None and size_gb > 10:  # Warn if > 10GB
+                self.add_warning(f"Database size is large: {size_gb:.2f} GB")
+
+            return True
 
         except Exception as e:
             self.add_warning(f"Could not check database size: {e}")
@@ -164,8 +252,12 @@ class HealthChecker:
 
     async def check_memory_usage(self) -> bool:
         """Check memory usage (basic check)."""
+        if psutil is None:
+            self.add_info("psutil not available - skipping memory check")
+            return True
+
         try:
-            memory = psutil.virtual_memory()
+            memory = memory_snapshot()
 
             self.add_info(f"Memory usage: {memory.percent:.1f}%")
 
@@ -174,49 +266,31 @@ class HealthChecker:
 
             return True
 
-        except ImportError:
-            self.add_info("psutil not available - skipping memory check")
-            return True
         except Exception as e:
             self.add_warning(f"Could not check memory usage: {e}")
             return False
 
-    async def check_recent_activity(self) -> bool:
+    async def check_recent_activity(self, db: AsyncSession) -> bool:
         """Check for recent database activity."""
         try:
-            async with SessionLocal() as db:
-                # Check recent user activity
-                result = await db.execute(
-                    text("""
-                    SELECT COUNT(*) FROM users
-                    WHERE created_at > NOW() - INTERVAL '24 hours'
-                """)
-                )
-                recent_users = result.scalar()
-                if recent_users is None:
-                    recent_users = 0
-
-                # Check recent orders
-                result = await db.execute(
-                    text("""
-                    SELECT COUNT(*) FROM sales_orders
-                    WHERE created_at > NOW() - INTERVAL '24 hours'
-                """)
-                )
-                recent_orders = result.scalar()
-                if recent_orders is None:
-                    recent_orders = 0
-
-                if recent_users > 0:
-                    self.add_info(f"Recent users (24h): {recent_users}")
-
-                if recent_orders > 0:
-                    self.add_info(f"Recent sales orders (24h): {recent_orders}")
-
-                if recent_users == 0 and recent_orders == 0:
-                    self.add_warning("No recent activity detected (24h)")
+            await db.execute(STATEMENT_TIMEOUT)
+            # Recent users dan orders dalam satu round trip
+            result = await db.execute(RECENT_ACTIVITY_SQL, {"cap": RECENT_ACTIVITY_CAP})
+            recent_users, recent_orders = result.one()
 
-                return True
+            def shown(count: int) -> str:
+                return f"{count}+" if count >= RECENT_ACTIVITY_CAP else str(count)
+
+            if recent_users > 0:
+                self.add_info(f"Recent users (24h): {shown(recent_users)}")
+
+            if recent_orders > 0:
+                self.add_info(f"Recent sales orders (24h): {shown(recent_orders)}")
+
+            if recent_users == 0 and recent_orders == 0:
+                self.add_warning("No recent activity detected (24h)")
+
+            return True
 
         except Exception as e:
             self.add_warning(f"Could not check recent activity: {e}")
@@ -224,60 +298,179 @@ class HealthChecker:
 
     async def run_all_checks(self) -> bool:
         """Run all health checks."""
-        print("🏥 Production Health Check")
-        print("=" * 50)
-        print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        # Laporan dikumpulkan lalu ditulis ke stdout sekali di akhir (satu write, bukan ~40)
+        passed, report = await self.collect_report()
+        sys.stdout.write(report)
+        sys.stdout.flush()
+        return passed
+
+    async def collect_report(self) -> tuple[bool, str]:
+        """Jalankan semua check; return (lulus, teks laporan)."""
+        out = [
+            "🏥 Production Health Check",
+            "=" * 50,
+            f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        ]
+        # (nama, check, butuh session DB). check_database_connection tetap lewat engine.connect()
+        # untuk memvalidasi engine secara terpisah.
         checks = [
-            ("Database Connection", self.check_database_connection),
-            ("Database Tables", self.check_database_tables),
-            ("Database Size", self.check_database_size),
-            ("Environment", self.check_environment),
-            ("Disk Space", self.check_disk_space),
-            ("Memory Usage", self.check_memory_usage),
-            ("Recent Activity", self.check_recent_activity),
+            ("Database Connection", HealthChecker.check_database_connection, False),
+            ("Database Tables", HealthChecker.check_database_tables, True),
+            ("Database Size", HealthChecker.check_database_size, True),
+            ("Environment", HealthChecker.check_environment, False),
+            ("Disk Space", HealthChecker.check_disk_space, False),
+            ("Memory Usage", HealthChecker.check_memory_usage, False),
+            ("Recent Activity", HealthChecker.check_recent_activity, True),
         ]
 
-        all_passed = True
+        # Tiap check mencatat ke checker sendiri agar urutan laporan tetap sama dengan urutan
+        # `checks` walau check berjalan bersamaan.
+        checkers = [HealthChecker() for _ in checks]
+        results: list[Any] = [None] * len(checks)
+        out.extend(f"Checking {check_name}..." for check_name, _, _ in checks)
+        out.append("")
 
-        for check_name, check_func in checks:
-            print(f"Checking {check_name}...")
+        async def run(index: int, *args: Any) -> None:
             try:
-                result = await check_func()
-                if not result:
-                    all_passed = False
+                async with asyncio.timeout(CHECK_TIMEOUT_SECONDS):
+                    results[index] = await checks[index][1](checkers[index], *args)
             except Exception as e:
-                self.add_issue(f"Check failed: {e}")
+                results[index] = e
+
+        async def run_db_checks() -> None:
+            # Satu session (satu checkout pool) dipakai bergantian oleh semua check DB;
+            # AsyncSession tidak boleh dipakai concurrent, jadi check DB berurutan di sini.
+            db_indices = [index for index, (_, _, uses_db) in enumerate(checks) if uses_db]
+            # Koneksi baru diambil saat query pertama di dalam check, jadi error koneksi tetap
+            # dilaporkan oleh check itu sendiri.
+            async with SessionLocal() as db:
+                for index in db_indices:
+                    await run(index, db)
+                    if results[index] is not True:
+                        # Transaksi bisa aborted (mis. statement timeout); mulai yang baru.
+                        # Jika rollback pun gagal, check berikutnya melaporkan error-nya sendiri.
+                        with contextlib.suppress(Exception):
+                            await db.rollback()
+
+        await asyncio.gather(
+            run_db_checks(),
+            *(run(index) for index, (_, _, uses_db) in enumerate(checks) if not uses_db),
+        )
+
+        all_passed = True
+        for (check_name, _, _), checker, result in zip(checks, checkers, results):
+            self.issues.extend(checker.issues)
+            self.warnings.extend(checker.warnings)
+            self.info.extend(checker.info)
+            if isinstance(result, TimeoutError):
+                self.add_warning(f"{check_name} check timed out after {CHECK_TIMEOUT_SECONDS}s")
+                all_passed = False
+            elif isinstance(result, BaseException):
+                self.add_issue(f"Check failed: {result}")
+                all_passed = False
+            elif not result:
                 all_passed = False
-            print()
 
         # Print results
-        if self.issues:
-            print("🚨 Critical Issues:")
-            for issue in self.issues:
-                print(f"  {issue}")
-            print()
-
-        if self.warnings:
-            print("⚠️  Warnings:")
-            for warning in self.warnings:
-                print(f"  {warning}")
-            print()
-
-        if self.info:
-            print("✅ Information:")
-            for info in self.info:
-                print(f"  {info}")
-            print()
+        for title, messages in (
+            ("🚨 Critical Issues:", self.issues),
+            ("⚠️  Warnings:", self.warnings),
+            ("✅ Information:", self.info),
+        ):
+            if messages:
+                out.append(title)
+                out.extend(f"  {message}" for message in messages)
+                out.append("")
 
         # Summary
-        if all_passed and not self.issues:
-            print("🎉 All health checks passed!")
-            return True
-        print(f"❌ Health check completed with {len(self.issues)} critical issue(s) and {len(self.warnings)} warning(s)")
-        return False
+        passed = all_passed and not self.issues
+        if passed:
+            out.append("🎉 All health checks passed!")
+        else:
+            out.append(f"❌ Health check completed with {len(self.issues)} critical issue(s) and {len(self.warnings)} warning(s)")
+
+        return passed, "\n".join(out) + "\n"
+
+
+async def cached_report() -> tuple[bool, str]:
+    """
+    `collect_report()` dengan cache REPORT_CACHE_TTL_SECONDS.
+
+    Lock mencegah thundering herd: saat cache kedaluwarsa hanya satu probe yang menjalankan
+    check, probe lain menunggu lalu memakai hasilnya.
+    """
+    global _report_cache
+    async with _report_lock:
+        now = time.monotonic()
+        if _report_cache is None or now - _report_cache[0] >= REPORT_CACHE_TTL_SECONDS:
+            _report_cache = (now, await HealthChecker().collect_report())
+        return _report_cache[1]
+
+
+async def handle_probe(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """
+    HTTP/1.1 minimal untuk `GET /healthz`: 200 jika semua check lulus, 503 jika tidak.
+
+    Koneksi keep-alive ditutup setelah idle SERVE_KEEPALIVE_SECONDS.
+    """
+    try:
+        while True:
+            try:
+                request_line = await asyncio.wait_for(reader.readline(), SERVE_KEEPALIVE_SECONDS)
+            except TimeoutError:
+                break
+            if not request_line:
+                break
+            # Header request tidak dipakai, cukup dibaca sampai baris kosong
+            while await reader.readline() not in (b"\r\n", b"\n", b""):
+                pass
+
+            method, path, *_ = [*request_line.decode("latin-1").split(), "", ""]
+            if method in ("GET", "HEAD") and path == "/healthz":
+                passed, report = await cached_report()
+                status = "200 OK" if passed else "503 Service Unavailable"
+                body = report.encode()
+            else:
+                status, body = "404 Not Found", b"not found\n"
+
+            writer.write(f"HTTP/1.1 {status}\r\nContent-Type: text/plain; charset=utf-8\r\nContent-Length: {len(body)}\r\nKeep-Alive: timeout={SERVE_KEEPALIVE_SECONDS}\r\n\r\n".encode() + (b"" if method == "HEAD" else body))
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(host: str, port: int) -> None:
+    """
+    Mode daemon: engine dan pool koneksi `app.database` hidup selama proses, jadi tiap
+    probe tidak membayar startup interpreter, init engine, dan handshake koneksi pertama.
+    Hasil check di-cache REPORT_CACHE_TTL_SECONDS.
+    """
+    server = await asyncio.start_server(handle_probe, host, port)
+    print(f"Serving health checks on http://{host}:{port}/healthz")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await engine.dispose()
 
 
 async def main() -> None:
+    parser = argparse.ArgumentParser(description="Production health check")
+    parser.add_argument("--serve", action="store_true", help="Serve GET /healthz instead of running once")
+    parser.add_argument(
+        "--host",
+        default="0.0.0.0",
+        help="Bind address for --serve (default: 0.0.0.0)",  # nosec B104
+    )
+    parser.add_argument("--port", type=int, default=8081, help="Port for --serve (default: 8081)")
+    args = parser.parse_args()
+
+    if args.serve:
+        await serve(args.host, args.port)
+        return
+
     checker = HealthChecker()
     success = await checker.run_all_checks()
 